@@ -55,12 +55,14 @@ from claude_code_proxy.utils.startup_helpers import (
     initialize_claude_detection_startup,
     initialize_claude_sdk_startup,
     initialize_database_startup,
+    initialize_http_client_startup,
     initialize_model_resolver_startup,
     initialize_permission_service_startup,
     setup_permission_service_shutdown,
     setup_scheduler_shutdown,
     setup_scheduler_startup,
     setup_session_manager_shutdown,
+    shutdown_http_client,
     shutdown_model_resolver,
     validate_claude_authentication_startup,
 )
@@ -76,6 +78,11 @@ LIFECYCLE_COMPONENTS: list[LifecycleComponent] = [
         "startup": initialize_database_startup,
         "shutdown": None,  # SQLite connections auto-close, no explicit shutdown needed
     },
+    {
+        "name": "HTTP Client",
+        "startup": initialize_http_client_startup,
+        "shutdown": shutdown_http_client,
+    },
     {
         "name": "Claude Authentication",
         "startup": validate_claude_authentication_startup,
@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
+import threading
 from typing import Annotated
 
 from fastapi import Depends, Request
 from structlog import get_logger
 
 from claude_code_proxy.config.settings import Settings, get_settings
-from claude_code_proxy.core.http import BaseProxyClient
+from claude_code_proxy.core.http import BaseProxyClient, create_http_client
 from claude_code_proxy.services.claude_sdk_service import ClaudeSDKService
 from claude_code_proxy.services.credentials.manager import CredentialsManager
 from claude_code_proxy.services.proxy_service import ProxyService
@@ -16,6 +17,10 @@ from claude_code_proxy.services.proxy_service import ProxyService
 
 logger = get_logger(__name__)
 
+# Guards creation of the fallback HTTP client; sync dependencies run in the
+# threadpool, so concurrent first requests could otherwise each create one
+_http_client_fallback_lock = threading.Lock()
+
 
 def get_cached_settings(request: Request) -> Settings:
     """Get cached settings from app state.
@@ -147,10 +152,19 @@ def get_proxy_service(
 
     """
     logger.debug("get_proxy_service")
-    # Create HTTP client for proxy
-    from claude_code_proxy.core.http import HTTPXClient
-
-    http_client = HTTPXClient()
+    # Reuse the HTTP client created at startup so upstream connections are
+    # pooled across requests
+    http_client = getattr(request.app.state, "http_client", None)
+    if http_client is None:
+        with _http_client_fallback_lock:
+            http_client = getattr(request.app.state, "http_client", None)
+            if http_client is None:
+                # Fallback for apps that skipped lifespan startup (e.g. tests);
+                # stored on the app so it is created once and shared like the
+                # startup client
+                logger.warning("HTTP client not found in app state, creating a new one")
+                http_client = create_http_client()
+                request.app.state.http_client = http_client
     proxy_client = BaseProxyClient(http_client)
 
     return ProxyService(
@@ -160,6 +174,8 @@ def get_proxy_service(
         proxy_mode="full",
         target_base_url=settings.reverse_proxy.target_url,
         app_state=request.app.state,  # Pass app state for detection data access
+        # The shared client is closed by the lifespan shutdown, not the service
+        owns_proxy_client=False,
     )
 
 
@@ -144,8 +144,8 @@ class RequestContentLoggingMiddleware(BaseHTTPMiddleware):
             # Try to parse body as JSON, fallback to string
             if body:
                 try:
-                    request_data["body"] = orjson.loads(body.decode("utf-8"))
-                except (orjson.JSONDecodeError, UnicodeDecodeError):
+                    request_data["body"] = orjson.loads(body)
+                except orjson.JSONDecodeError:
                     try:
                         request_data["body"] = body.decode("utf-8", errors="replace")
                     except (UnicodeDecodeError, ValueError):
@@ -222,9 +222,9 @@ class RequestContentLoggingMiddleware(BaseHTTPMiddleware):
             try:
                 # Convert to bytes if needed
                 body_bytes = bytes(body) if isinstance(body, memoryview) else body
-                # Try to parse as JSON
-                response_data["body"] = orjson.loads(body_bytes.decode("utf-8"))
-            except (orjson.JSONDecodeError, UnicodeDecodeError):
+                # Try to parse as JSON (orjson validates UTF-8 itself)
+                response_data["body"] = orjson.loads(body_bytes)
+            except orjson.JSONDecodeError:
                 try:
                     # Fallback to string
                     body_bytes = bytes(body) if isinstance(body, memoryview) else body
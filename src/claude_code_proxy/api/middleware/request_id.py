@@ -1,12 +1,12 @@
 """Request ID middleware for generating and tracking request IDs."""
 
-import shortuuid
 import structlog
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
 from starlette.types import ASGIApp
 
 from claude_code_proxy.core.request_context import RequestContext
+from claude_code_proxy.utils.id_generator import generate_request_id
 
 
 logger = structlog.get_logger(__name__)
@@ -38,7 +38,7 @@ class RequestIDMiddleware(BaseHTTPMiddleware):
 
         """
         # Generate or extract request ID
-        request_id = request.headers.get("x-request-id") or shortuuid.uuid()
+        request_id = request.headers.get("x-request-id") or generate_request_id()
 
         # Create minimal context
         ctx = RequestContext(
@@ -6,6 +6,10 @@ from fastapi import Response
 from starlette.types import Receive, Scope, Send
 
 
+# Upstream framing headers that must be recomputed for the body we actually send
+_FRAMING_HEADERS = frozenset({"content-length", "transfer-encoding"})
+
+
 class ProxyResponse(Response):
     """Custom response class that preserves all headers from upstream API.
 
@@ -56,18 +60,13 @@ class ProxyResponse(Response):
         for name, value in self._preserve_headers.items():
             lower_name = name.lower()
             # Skip content-length and transfer-encoding as we'll set them correctly
-            if (
-                lower_name not in ["content-length", "transfer-encoding"]
-                and lower_name not in seen_headers
-            ):
+            if lower_name not in _FRAMING_HEADERS and lower_name not in seen_headers:
                 headers_list.append((lower_name.encode(), value.encode()))
                 seen_headers.add(lower_name)
 
-        # Always set correct content-length based on actual body
-        if self.body:
-            headers_list.append((b"content-length", str(len(self.body)).encode()))
-        else:
-            headers_list.append((b"content-length", b"0"))
+        # Always set correct content-length based on actual body; this is the
+        # only place it is computed since we write raw ASGI messages here
+        headers_list.append((b"content-length", str(len(self.body)).encode()))
 
         # Ensure we have content-type
         has_content_type = any(h[0] == b"content-type" for h in headers_list)
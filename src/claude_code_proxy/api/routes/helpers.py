@@ -36,6 +36,26 @@ def strip_problematic_headers(headers: dict[str, str]) -> dict[str, str]:
     }
 
 
+async def get_request_body(request: Request) -> bytes:
+    """Return the request body, preferring the copy cached on request state.
+
+    The rotation middleware buffers the body and stores it as
+    ``request.state.body``; reusing it avoids pulling the body through the
+    middleware receive chain a second time.
+
+    Args:
+        request: FastAPI request object
+
+    Returns:
+        Request body bytes
+
+    """
+    body: bytes | None = getattr(request.state, "body", None)
+    if body is None:
+        body = await request.body()
+    return body
+
+
 def extract_request_data(
     request: Request,
 ) -> tuple[dict[str, str], dict[str, str | list[str]] | None, str]:
@@ -120,9 +140,18 @@ async def create_sse_stream_generator(response_body: bytes) -> AsyncIterator[byt
         Formatted SSE data chunks
 
     """
-    for line in response_body.decode().split("\n"):
+    # Scan the bytes in place rather than decoding and splitting the whole
+    # body into a list of lines up front
+    start = 0
+    end = len(response_body)
+    while start < end:
+        newline = response_body.find(b"\n", start)
+        if newline == -1:
+            newline = end
+        line = response_body[start:newline]
         if line.strip():
-            yield f"{line}\n".encode()
+            yield line + b"\n"
+        start = newline + 1
 
 
 def prepare_streaming_headers(response_headers: dict[str, str]) -> dict[str, str]:
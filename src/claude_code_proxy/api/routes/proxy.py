@@ -10,6 +10,7 @@ from fastapi.responses import StreamingResponse
 from claude_code_proxy.api.dependencies import ProxyServiceDep
 from claude_code_proxy.api.routes.helpers import (
     extract_request_data,
+    get_request_body,
     handle_proxy_response,
 )
 from claude_code_proxy.auth.conditional import ConditionalAuthDep
@@ -35,7 +36,7 @@ async def create_anthropic_message(
     directly to Claude via the proxy service.
     """
     try:
-        body = await request.body()
+        body = await get_request_body(request)
         headers, query_params, service_path = extract_request_data(request)
 
         response = await proxy_service.handle_request(
@@ -83,7 +84,7 @@ async def create_openai_chat_completion(
     translates them for Claude via the proxy service.
     """
     try:
-        body = await request.body()
+        body = await get_request_body(request)
         headers, query_params, service_path = extract_request_data(request)
 
         response = await proxy_service.handle_request(
@@ -1,13 +1,19 @@
 """JWT token generation and validation for API keys."""
 
+import time
 from datetime import UTC, datetime, timedelta
 
-import jwt
+from cachetools import TTLCache
 from structlog import get_logger
 
 
 logger = get_logger(__name__)
 
+# Validated payloads are cached per token so repeated requests with the same
+# API key skip signature verification; entries never outlive the token's exp
+DECODE_CACHE_MAXSIZE = 1024
+DECODE_CACHE_TTL_SECONDS = 300
+
 
 class JWTHandler:
     """Handles JWT token generation and validation for API keys."""
@@ -24,6 +30,9 @@ class JWTHandler:
         if len(secret_key) < 32:
             logger.warning("jwt_secret_key_short", length=len(secret_key))
         self.secret_key = secret_key
+        self._decode_cache: TTLCache[str, dict[str, str]] = TTLCache(
+            maxsize=DECODE_CACHE_MAXSIZE, ttl=DECODE_CACHE_TTL_SECONDS
+        )
 
     def generate_token(
         self,
@@ -42,6 +51,10 @@ class JWTHandler:
             Encoded JWT token string
 
         """
+        # PyJWT pulls in its crypto backends on import, so defer it until a
+        # token is actually signed or verified
+        import jwt
+
         now = datetime.now(UTC)
         payload = {
             "sub": user_id,  # Subject (user)
@@ -55,6 +68,9 @@ class JWTHandler:
     def validate_token(self, token: str) -> dict[str, str]:
         """Validate and decode a JWT token.
 
+        Successful results are cached by token string until the earlier of
+        the cache TTL and the token's own ``exp`` claim.
+
         Args:
             token: JWT token string
 
@@ -65,6 +81,15 @@ class JWTHandler:
             ValueError: If token is invalid or expired
 
         """
+        cached = self._decode_cache.get(token)
+        if cached is not None:
+            if int(cached["exp"]) > time.time():
+                return dict(cached)
+            self._decode_cache.pop(token, None)
+            raise ValueError("Token has expired")
+
+        import jwt
+
         try:
             payload: dict[str, str] = jwt.decode(
                 token,
@@ -72,7 +97,8 @@ class JWTHandler:
                 algorithms=[self.ALGORITHM],
                 options={"require": ["sub", "kid", "exp"]},
             )
-            return payload
+            self._decode_cache[token] = payload
+            return dict(payload)
         except jwt.ExpiredSignatureError as e:
             raise ValueError("Token has expired") from e
         except jwt.InvalidTokenError as e:
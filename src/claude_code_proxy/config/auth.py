@@ -16,13 +16,16 @@ from claude_code_proxy.auth.oauth.constants import (
 )
 
 
+_DEFAULT_STORAGE_PATHS = (
+    Path("~/.config/claude-code-proxy/credentials.json"),
+    Path("~/.claude/.credentials.json"),
+    Path("~/.config/claude/.credentials.json"),
+)
+
+
 def _get_default_storage_paths() -> list[Path]:
     """Get default storage paths"""
-    return [
-        Path("~/.config/claude-code-proxy/credentials.json"),
-        Path("~/.claude/.credentials.json"),
-        Path("~/.config/claude/.credentials.json"),
-    ]
+    return list(_DEFAULT_STORAGE_PATHS)
 
 
 class OAuthSettings(BaseModel):
@@ -60,8 +63,8 @@ class OAuthSettings(BaseModel):
         default=OAUTH_REDIRECT_URI,
         description="OAuth redirect URI (from shared constants)",
     )
-    scopes: list[str] = Field(
-        default_factory=lambda: OAUTH_SCOPES.copy(),
+    scopes: tuple[str, ...] = Field(
+        default=tuple(OAUTH_SCOPES),
         description="OAuth scopes to request (from shared constants)",
     )
     request_timeout: int = Field(
@@ -90,7 +93,7 @@ class CredentialStorageSettings(BaseModel):
     """Settings for credential storage locations."""
 
     storage_paths: list[Path] = Field(
-        default_factory=lambda: _get_default_storage_paths(),
+        default_factory=_get_default_storage_paths,
         description="Paths to search for credentials files",
     )
     credentials_dir: Path = Field(
@@ -2,6 +2,7 @@
 
 import os
 from abc import ABC, abstractmethod
+from functools import cache
 from pathlib import Path
 from typing import TYPE_CHECKING, Any
 
@@ -20,11 +21,17 @@ __all__ = [
     "HTTPError",
     "HTTPTimeoutError",
     "HTTPXClient",
+    "create_http_client",
 ]
 
 
 logger = structlog.get_logger(__name__)
 
+# Pool sizing for the shared upstream client. Every proxied request goes to
+# the same host, so keep more idle connections than httpx's default of 20
+_MAX_CONNECTIONS = 200
+_MAX_KEEPALIVE_CONNECTIONS = 100
+
 
 if TYPE_CHECKING:
     import httpx
@@ -59,6 +66,29 @@ class HTTPClient(ABC):
 
         """
 
+    @abstractmethod
+    async def stream(
+        self,
+        method: str,
+        url: str,
+        headers: dict[str, str],
+        content: bytes | None = None,
+        timeout: float | None = None,
+    ) -> Any:
+        """Create a streaming HTTP request.
+
+        Args:
+            method: HTTP method
+            url: Target URL
+            headers: HTTP headers
+            content: Request body (optional)
+            timeout: Request timeout in seconds (optional)
+
+        Returns:
+            Async context manager yielding the streaming response
+
+        """
+
     @abstractmethod
     async def close(self) -> None:
         """Close any resources held by the HTTP client."""
@@ -108,7 +138,12 @@ class BaseProxyClient:
 
 
 class HTTPXClient(HTTPClient):
-    """HTTPX-based HTTP client implementation."""
+    """HTTPX-based HTTP client implementation.
+
+    A single underlying ``httpx.AsyncClient`` is created lazily and reused for
+    every request (regular and streaming) so connections are kept alive
+    across requests. Per-request timeouts are passed to httpx directly.
+    """
 
     def __init__(
         self,
@@ -131,7 +166,7 @@ class HTTPXClient(HTTPClient):
         self.verify = verify
         self._client: httpx.AsyncClient | None = None
 
-    async def _get_client(self) -> "httpx.AsyncClient":
+    def _get_client(self) -> "httpx.AsyncClient":
         """Get or create the HTTPX client."""
         if self._client is None:
             import httpx
@@ -140,6 +175,10 @@ class HTTPXClient(HTTPClient):
                 timeout=self.timeout,
                 proxy=self.proxy,
                 verify=self.verify,
+                limits=httpx.Limits(
+                    max_connections=_MAX_CONNECTIONS,
+                    max_keepalive_connections=_MAX_KEEPALIVE_CONNECTIONS,
+                ),
             )
         return self._client
 
@@ -170,24 +209,14 @@ class HTTPXClient(HTTPClient):
         import httpx
 
         try:
-            client = await self._get_client()
-
-            # Use provided timeout if available
-            if timeout is not None:
-                # Create a new client with different timeout if needed
-                import httpx
-
-                client = httpx.AsyncClient(
-                    timeout=timeout,
-                    proxy=self.proxy,
-                    verify=self.verify,
-                )
+            client = self._get_client()
 
             response = await client.request(
                 method=method,
                 url=url,
                 headers=headers,
                 content=body,
+                timeout=timeout if timeout is not None else httpx.USE_CLIENT_DEFAULT,
             )
 
             # Always return the response, even for error status codes
@@ -219,6 +248,7 @@ class HTTPXClient(HTTPClient):
         url: str,
         headers: dict[str, str],
         content: bytes | None = None,
+        timeout: float | None = None,
     ) -> Any:
         """Create a streaming HTTP request.
 
@@ -227,17 +257,21 @@ class HTTPXClient(HTTPClient):
             url: Target URL
             headers: HTTP headers
             content: Request body (optional)
+            timeout: Request timeout in seconds (optional)
 
         Returns:
             HTTPX streaming response context manager
 
         """
-        client = await self._get_client()
+        import httpx
+
+        client = self._get_client()
         return client.stream(
             method=method,
             url=url,
             headers=headers,
             content=content,
+            timeout=timeout if timeout is not None else httpx.USE_CLIENT_DEFAULT,
         )
 
     async def close(self) -> None:
@@ -247,9 +281,29 @@ class HTTPXClient(HTTPClient):
             self._client = None
 
 
+def create_http_client(timeout: float = 240.0) -> HTTPXClient:
+    """Create an HTTPX client configured from proxy/SSL environment variables.
+
+    Args:
+        timeout: Default request timeout in seconds
+
+    Returns:
+        HTTPXClient instance
+
+    """
+    return HTTPXClient(
+        timeout=timeout,
+        proxy=get_proxy_url(),
+        verify=get_ssl_context(),
+    )
+
+
+@cache
 def get_proxy_url() -> str | None:
     """Get proxy URL from environment variables.
 
+    Resolved once per process; proxy settings do not change at runtime.
+
     Returns:
         str or None: Proxy URL if any proxy is set
 
@@ -272,9 +326,12 @@ def get_proxy_url() -> str | None:
     return proxy_url
 
 
+@cache
 def get_ssl_context() -> str | bool:
     """Get SSL context configuration from environment variables.
 
+    Resolved once per process, including the CA bundle existence check.
+
     Returns:
         SSL verification configuration:
         - Path to CA bundle file
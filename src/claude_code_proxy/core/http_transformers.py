@@ -1,11 +1,13 @@
 """HTTP-level transformers for proxy service."""
 
+import urllib.parse
 from typing import Any
 
 import orjson
 import structlog
 from typing_extensions import TypedDict
 
+from claude_code_proxy.adapters.openai.adapter import OpenAIAdapter
 from claude_code_proxy.core.transformers import RequestTransformer, ResponseTransformer
 from claude_code_proxy.core.types import ProxyRequest, ProxyResponse, TransformContext
 
@@ -15,6 +17,49 @@ logger = structlog.get_logger(__name__)
 # Claude Code system prompt constants
 CLAUDE_CODE_PROMPT = "You are Claude Code, Anthropic's official CLI for Claude."
 
+# Client headers that are never forwarded upstream
+_EXCLUDED_PROXY_HEADERS = frozenset(
+    {
+        "host",
+        "x-forwarded-for",
+        "x-forwarded-proto",
+        "x-forwarded-host",
+        "forwarded",
+        # Authentication headers to be replaced
+        "authorization",
+        "x-api-key",
+        # Compression headers to avoid decompression issues
+        "accept-encoding",
+        "content-encoding",
+        # CORS headers - should not be forwarded to upstream
+        "origin",
+        "access-control-request-method",
+        "access-control-request-headers",
+        "access-control-allow-origin",
+        "access-control-allow-methods",
+        "access-control-allow-headers",
+        "access-control-allow-credentials",
+        "access-control-max-age",
+        "access-control-expose-headers",
+    }
+)
+
+
+def _is_openai_path(path: str) -> bool:
+    """Check whether a request path targets the OpenAI-compatible API.
+
+    Shared by the request and response transformers so both classify a path
+    the same way.
+
+    Args:
+        path: Request path
+
+    Returns:
+        True if the path is an OpenAI-format endpoint
+
+    """
+    return "/openai/" in path or "/chat/completions" in path
+
 
 def get_detected_system_field(
     app_state: Any = None, injection_mode: str = "minimal"
@@ -98,7 +143,7 @@ class HTTPRequestTransformer(RequestTransformer):
         """
         # Transform path
         transformed_path = self.transform_path(
-            request.url.split("?")[0].split("/", 3)[-1]
+            request.url.partition("?")[0].split("/", 3)[-1]
             if "/" in request.url
             else request.url
         )
@@ -109,8 +154,6 @@ class HTTPRequestTransformer(RequestTransformer):
 
         # Add query parameters
         if request.params:
-            import urllib.parse
-
             query_string = urllib.parse.urlencode(request.params)
             new_url = f"{new_url}?{query_string}"
 
@@ -177,6 +220,7 @@ class HTTPRequestTransformer(RequestTransformer):
         target_base_url: str = "https://api.anthropic.com",
         app_state: Any = None,
         injection_mode: str = "minimal",
+        parsed_body: dict[str, Any] | None = None,
     ) -> RequestData:
         """Transform request using direct parameters from ProxyService.
 
@@ -193,13 +237,14 @@ class HTTPRequestTransformer(RequestTransformer):
             target_base_url: Base URL for the target API
             app_state: Optional app state containing detection data
             injection_mode: System prompt injection mode
+            parsed_body: ``body`` already parsed by the caller, reused instead
+                of parsing again. It is mutated in place (the system prompt is
+                injected into it), so pass a copy if the caller still needs it.
 
         Returns:
             Dictionary with transformed request data (method, url, headers, body)
 
         """
-        import urllib.parse
-
         # Transform path
         transformed_path = self.transform_path(path, self.proxy_mode)
         target_url = f"{target_base_url.rstrip('/')}{transformed_path}"
@@ -218,7 +263,7 @@ class HTTPRequestTransformer(RequestTransformer):
         proxy_body = None
         if body:
             proxy_body = self.transform_request_body(
-                body, path, self.proxy_mode, app_state, injection_mode
+                body, path, self.proxy_mode, app_state, injection_mode, parsed_body
             )
 
         # Transform headers (and update Content-Length if body changed)
@@ -242,12 +287,13 @@ class HTTPRequestTransformer(RequestTransformer):
             query_string = urllib.parse.urlencode(query_params)
             target_url = f"{target_url}?{query_string}"
 
-        return RequestData(
-            method=method,
-            url=target_url,
-            headers=proxy_headers,
-            body=proxy_body,
-        )
+        # A dict literal; calling the TypedDict class costs a kwargs call
+        return {
+            "method": method,
+            "url": target_url,
+            "headers": proxy_headers,
+            "body": proxy_body,
+        }
 
     def transform_path(self, path: str, proxy_mode: str = "full") -> str:
         """Transform request path."""
@@ -274,48 +320,26 @@ class HTTPRequestTransformer(RequestTransformer):
     ) -> dict[str, str]:
         """Create proxy headers from original headers with Claude CLI identity."""
         proxy_headers = {}
-
-        # Strip potentially problematic headers
-        excluded_headers = {
-            "host",
-            "x-forwarded-for",
-            "x-forwarded-proto",
-            "x-forwarded-host",
-            "forwarded",
-            # Authentication headers to be replaced
-            "authorization",
-            "x-api-key",
-            # Compression headers to avoid decompression issues
-            "accept-encoding",
-            "content-encoding",
-            # CORS headers - should not be forwarded to upstream
-            "origin",
-            "access-control-request-method",
-            "access-control-request-headers",
-            "access-control-allow-origin",
-            "access-control-allow-methods",
-            "access-control-allow-headers",
-            "access-control-allow-credentials",
-            "access-control-max-age",
-            "access-control-expose-headers",
-        }
+        # Lowercased names of the copied headers, for case-insensitive checks
+        present_headers: set[str] = set()
 
         # Copy important headers (excluding problematic ones)
         for key, value in headers.items():
             lower_key = key.lower()
-            if lower_key not in excluded_headers:
+            if lower_key not in _EXCLUDED_PROXY_HEADERS:
                 proxy_headers[key] = value
+                present_headers.add(lower_key)
 
         # Set authentication with OAuth token
         if access_token:
-            proxy_headers["Authorization"] = f"Bearer {access_token}"
+            self.apply_access_token(proxy_headers, access_token)
 
         # Set defaults for essential headers
-        if "content-type" not in [k.lower() for k in proxy_headers]:
+        if "content-type" not in present_headers:
             proxy_headers["Content-Type"] = "application/json"
-        if "accept" not in [k.lower() for k in proxy_headers]:
+        if "accept" not in present_headers:
             proxy_headers["Accept"] = "application/json"
-        if "connection" not in [k.lower() for k in proxy_headers]:
+        if "connection" not in present_headers:
             proxy_headers["Connection"] = "keep-alive"
 
         # Use detected Claude CLI headers when available
@@ -356,6 +380,16 @@ class HTTPRequestTransformer(RequestTransformer):
 
         return proxy_headers
 
+    def apply_access_token(self, headers: dict[str, str], access_token: str) -> None:
+        """Set the upstream Authorization header in place.
+
+        Args:
+            headers: Proxy headers built by ``create_proxy_headers``
+            access_token: OAuth access token
+
+        """
+        headers["Authorization"] = f"Bearer {access_token}"
+
     def _count_cache_control_blocks(
         self, data: dict[str, Any], early_exit_threshold: int | None = None
     ) -> dict[str, int]:
@@ -575,21 +609,56 @@ class HTTPRequestTransformer(RequestTransformer):
         proxy_mode: str = "full",
         app_state: Any = None,
         injection_mode: str = "minimal",
+        data: dict[str, Any] | None = None,
     ) -> bytes:
-        """Transform request body."""
+        """Transform request body.
+
+        The body is parsed once and the parsed data is handed to each step.
+
+        Args:
+            body: Original request body as bytes
+            path: Request path
+            proxy_mode: Transformation mode
+            app_state: Optional app state containing detection data
+            injection_mode: System prompt injection mode ('minimal' or 'full')
+            data: ``body`` already parsed, reused instead of parsing again;
+                mutated in place
+
+        Returns:
+            Transformed request body as bytes
+
+        """
         if not body:
             return body
 
+        if data is None:
+            try:
+                data = orjson.loads(body)
+            except (orjson.JSONDecodeError, UnicodeDecodeError):
+                # Left to the steps below, which parse again and log the failure
+                data = None
+
         # Check if this is an OpenAI request and transform it
-        if self._is_openai_request(path, body):
-            # Transform OpenAI format to Anthropic format
-            body = self._transform_openai_to_anthropic(body)
+        if self._is_openai_request(path, body, data):
+            if data is None:
+                # Not valid JSON: the conversion logs it and keeps the body
+                body = self._transform_openai_to_anthropic(body)
+            else:
+                # Convert the parsed data directly; the system prompt step
+                # serializes the result once
+                anthropic_data = self._adapt_openai_request(data)
+                if anthropic_data is not None:
+                    data = anthropic_data
 
         # Apply system prompt transformation for Claude Code identity
-        return self.transform_system_prompt(body, app_state, injection_mode)
+        return self.transform_system_prompt(body, app_state, injection_mode, data)
 
     def transform_system_prompt(
-        self, body: bytes, app_state: Any = None, injection_mode: str = "minimal"
+        self,
+        body: bytes,
+        app_state: Any = None,
+        injection_mode: str = "minimal",
+        data: dict[str, Any] | None = None,
     ) -> bytes:
         """Transform system prompt based on injection mode.
 
@@ -597,13 +666,16 @@ class HTTPRequestTransformer(RequestTransformer):
             body: Original request body as bytes
             app_state: Optional app state containing detection data
             injection_mode: System prompt injection mode ('minimal' or 'full')
+            data: ``body`` already parsed, used instead of parsing it again;
+                mutated in place
 
         Returns:
             Transformed request body as bytes with system prompt injection
 
         """
         try:
-            data = orjson.loads(body)
+            if data is None:
+                data = orjson.loads(body)
         except (orjson.JSONDecodeError, UnicodeDecodeError) as e:
             # Return original if not valid JSON
             logger.warning(
@@ -661,16 +733,29 @@ class HTTPRequestTransformer(RequestTransformer):
         result: bytes = orjson.dumps(data)
         return result
 
-    def _is_openai_request(self, path: str, body: bytes) -> bool:
-        """Check if this is an OpenAI API request."""
+    def _is_openai_request(
+        self, path: str, body: bytes, data: dict[str, Any] | None = None
+    ) -> bool:
+        """Check if this is an OpenAI API request.
+
+        Args:
+            path: Request path
+            body: Request body as bytes
+            data: ``body`` already parsed, used instead of parsing it again
+
+        Returns:
+            True if the path or body matches the OpenAI format
+
+        """
         # Check path-based indicators
-        if "/openai/" in path or "/chat/completions" in path:
+        if _is_openai_path(path):
             return True
 
         # Check body-based indicators
         if body:
             try:
-                data = orjson.loads(body)
+                if data is None:
+                    data = orjson.loads(body)
                 # Look for OpenAI-specific patterns
                 model = data.get("model", "")
                 if model.startswith(("gpt-", "o1-", "text-davinci")):
@@ -695,31 +780,52 @@ class HTTPRequestTransformer(RequestTransformer):
     def _transform_openai_to_anthropic(self, body: bytes) -> bytes:
         """Transform OpenAI request format to Anthropic format."""
         try:
-            # Use the OpenAI adapter for transformation
-            from claude_code_proxy.adapters.openai.adapter import OpenAIAdapter
+            openai_data = orjson.loads(body)
+        except (orjson.JSONDecodeError, UnicodeDecodeError) as e:
+            logger.warning(
+                "openai_transformation_failed",
+                error=str(e),
+                operation="transform_openai_to_anthropic",
+            )
+            # Return original body if transformation fails
+            return body
+
+        anthropic_data = self._adapt_openai_request(openai_data)
+        if anthropic_data is None:
+            return body
+        result: bytes = orjson.dumps(anthropic_data)
+        return result
+
+    def _adapt_openai_request(self, data: dict[str, Any]) -> dict[str, Any] | None:
+        """Convert parsed OpenAI request data to Anthropic format.
+
+        Args:
+            data: Parsed OpenAI request
 
+        Returns:
+            Anthropic request data, or None if the conversion failed
+
+        """
+        try:
+            # Use the OpenAI adapter for transformation
             adapter = OpenAIAdapter()
-            openai_data = orjson.loads(body)
-            anthropic_data = adapter.adapt_request(openai_data)
-            result: bytes = orjson.dumps(anthropic_data)
-            return result
+            return adapter.adapt_request(data)
 
         except (
-            orjson.JSONDecodeError,
             ValueError,
             TypeError,
             KeyError,
             AttributeError,
         ) as e:
-            # Catches: JSON parse errors, invalid data types, missing keys, adapter instantiation errors
+            # Catches: invalid data types, missing keys, adapter instantiation errors
             # Note: Broad exception needed as adapter.adapt_request() can raise various errors
             logger.warning(
                 "openai_transformation_failed",
                 error=str(e),
                 operation="transform_openai_to_anthropic",
             )
-            # Return original body if transformation fails
-            return body
+            # The caller keeps the original request if transformation fails
+            return None
 
 
 class HTTPResponseTransformer(ResponseTransformer):
@@ -790,7 +896,7 @@ class HTTPResponseTransformer(ResponseTransformer):
             metadata=response.metadata,
         )
 
-    async def transform_proxy_response(
+    def transform_proxy_response(
         self,
         status_code: int,
         headers: dict[str, str],
@@ -819,8 +925,6 @@ class HTTPResponseTransformer(ResponseTransformer):
             transformed_error_body = body
             if self._is_openai_request(original_path):
                 try:
-                    from claude_code_proxy.adapters.openai.adapter import OpenAIAdapter
-
                     error_data = orjson.loads(body)
                     openai_adapter = OpenAIAdapter()
                     openai_error = openai_adapter.adapt_error(error_data)
@@ -829,11 +933,11 @@ class HTTPResponseTransformer(ResponseTransformer):
                     # Keep original error if parsing fails
                     pass
 
-            return ResponseData(
-                status_code=status_code,
-                headers=headers,
-                body=transformed_error_body,
-            )
+            return {
+                "status_code": status_code,
+                "headers": headers,
+                "body": transformed_error_body,
+            }
 
         # For successful responses, transform normally
         transformed_body = self.transform_response_body(body, original_path, proxy_mode)
@@ -842,11 +946,11 @@ class HTTPResponseTransformer(ResponseTransformer):
             headers, original_path, len(transformed_body), proxy_mode
         )
 
-        return ResponseData(
-            status_code=status_code,
-            headers=transformed_headers,
-            body=transformed_body,
-        )
+        return {
+            "status_code": status_code,
+            "headers": transformed_headers,
+            "body": transformed_body,
+        }
 
     def transform_response_body(
         self, body: bytes, path: str, proxy_mode: str = "full"
@@ -888,4 +992,4 @@ class HTTPResponseTransformer(ResponseTransformer):
 
     def _is_openai_request(self, path: str) -> bool:
         """Check if this is an OpenAI API request."""
-        return "/openai/" in path or "/chat/completions" in path
+        return _is_openai_path(path)
@@ -5,6 +5,7 @@ from collections.abc import MutableMapping
 from pathlib import Path
 from typing import Any, TextIO
 
+import orjson
 import structlog
 from rich.console import Console
 from rich.traceback import Traceback
@@ -29,12 +30,61 @@ def format_timestamp_ms(
     return event_dict
 
 
+def orjson_dumps(obj: Any, **kwargs: Any) -> str:
+    """Serialize a log event with orjson for JSONRenderer.
+
+    The stdlib handlers expect formatted records as str, so the bytes are
+    decoded once here rather than rendered through the json module.
+
+    Args:
+        obj: Event dict to serialize
+        **kwargs: Keyword arguments from JSONRenderer (the ``default`` hook)
+
+    Returns:
+        JSON string
+
+    """
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS, **kwargs).decode()
+
+
+def is_debug_enabled(name: str) -> bool:
+    """Check whether debug events from a module's logger would be emitted.
+
+    structlog loggers wrap the stdlib logger of the same name and drop
+    filtered events in filter_by_level, so callers can check first and skip
+    building event fields that would be discarded. The level check itself is
+    cached by logging.
+
+    Args:
+        name: Logger name, usually the calling module's ``__name__``
+
+    Returns:
+        True if DEBUG events are enabled for the logger
+
+    """
+    return logging.getLogger(name).isEnabledFor(logging.DEBUG)
+
+
+def is_info_enabled(name: str) -> bool:
+    """Check whether info events from a module's logger would be emitted.
+
+    Args:
+        name: Logger name, usually the calling module's ``__name__``
+
+    Returns:
+        True if INFO events are enabled for the logger
+
+    """
+    return logging.getLogger(name).isEnabledFor(logging.INFO)
+
+
 def configure_structlog(log_level: int = logging.INFO) -> None:
     """Configure structlog with shared processors following canonical pattern."""
     # Shared processors for all structlog loggers
     processors: list[Processor] = [
-        structlog.contextvars.merge_contextvars,  # For request context in web apps
+        # Drop filtered events before any other processor does work on them
         structlog.stdlib.filter_by_level,
+        structlog.contextvars.merge_contextvars,  # For request context in web apps
         structlog.stdlib.add_log_level,
         structlog.stdlib.add_logger_name,
     ]
@@ -165,7 +215,7 @@ def setup_logging(
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(log_level)
     console_renderer = (
-        structlog.processors.JSONRenderer()
+        structlog.processors.JSONRenderer(serializer=orjson_dumps)
         if json_logs
         else structlog.dev.ConsoleRenderer(
             exception_formatter=rich_traceback  # structlog.dev.rich_traceback,  # Use rich for better formatting
@@ -196,7 +246,7 @@ def setup_logging(
         file_handler.setFormatter(
             structlog.stdlib.ProcessorFormatter(
                 foreign_pre_chain=file_processors,
-                processor=structlog.processors.JSONRenderer(),
+                processor=structlog.processors.JSONRenderer(serializer=orjson_dumps),
             )
         )
         root_logger.addHandler(file_handler)
@@ -1,10 +1,10 @@
 """Migration utilities for transitioning from JSON to SQLite."""
 
-import json
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
+import orjson
 import structlog
 
 from claude_code_proxy.db.repositories import AccountRepository
@@ -27,8 +27,8 @@ async def migrate_from_accounts_json(json_path: Path) -> int:
         return 0
 
     try:
-        data = json.loads(json_path.read_text())
-    except (json.JSONDecodeError, OSError):
+        data = orjson.loads(json_path.read_bytes())
+    except (orjson.JSONDecodeError, OSError):
         logger.exception("migration_failed_read", path=str(json_path))
         return 0
 
@@ -326,7 +326,8 @@ class RotationPool:
         self._account_order: list[str] = []  # For consistent round-robin
         self._account_cycle: Iterator[str] | None = None
         self._lock = asyncio.Lock()
-        self._last_modified: float | None = None
+        # (st_mtime_ns, st_size) of the accounts file at last load/save
+        self._last_stat: tuple[int, int] | None = None
         self._rate_limit_repo = RateLimitRepository()
 
         if auto_load:
@@ -442,9 +443,7 @@ class RotationPool:
             self._account_cycle = None
 
         # Track file modification time
-        path = self.accounts_path
-        if path.exists():
-            self._last_modified = path.stat().st_mtime
+        self._last_stat = self._stat_signature()
 
         logger.info(
             "rotation_pool_loaded",
@@ -459,9 +458,7 @@ class RotationPool:
 
         if success:
             # Update last modified time
-            path = self.accounts_path
-            if path.exists():
-                self._last_modified = path.stat().st_mtime
+            self._last_stat = self._stat_signature()
 
         return success
 
@@ -709,19 +706,30 @@ class RotationPool:
         logger.info("account_removed", account=account_name)
         return True
 
+    def _stat_signature(self) -> tuple[int, int] | None:
+        """Get the (mtime_ns, size) signature of the accounts file.
+
+        Returns:
+            Signature tuple, or None if the file does not exist
+
+        """
+        try:
+            st = self.accounts_path.stat()
+        except FileNotFoundError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
     def has_file_changed(self) -> bool:
         """Check if accounts file has been modified since last load.
 
+        Uses a single stat() call and takes no lock, so it is safe to call
+        as a cheap pre-check before acquiring the pool lock.
+
         Returns:
             True if file has changed
 
         """
-        path = self.accounts_path
-        if not path.exists():
-            return self._last_modified is not None
-
-        current_mtime = path.stat().st_mtime
-        return current_mtime != self._last_modified
+        return self._stat_signature() != self._last_stat
 
     def reload_if_changed(self) -> bool:
         """Reload accounts if file has changed.
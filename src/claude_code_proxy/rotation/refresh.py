@@ -40,8 +40,11 @@ MAX_REFRESH_RETRIES = 3
 class TokenRefreshScheduler:
     """Background scheduler for proactive token refresh.
 
+    A single scheduler (one APScheduler job, one HTTP client) serves every
+    registered rotation pool.
+
     Features:
-    - Checks all accounts every minute
+    - Checks all accounts of all registered pools every minute
     - Refreshes tokens within 10 minutes of expiration
     - Retries with exponential backoff on failures
     - Persists refreshed tokens immediately
@@ -50,19 +53,21 @@ class TokenRefreshScheduler:
 
     def __init__(
         self,
-        pool: RotationPool,
+        pool: RotationPool | None = None,
         check_interval: int = REFRESH_CHECK_INTERVAL_SECONDS,
         refresh_buffer: int = REFRESH_BUFFER_SECONDS,
     ):
         """Initialize token refresh scheduler.
 
         Args:
-            pool: Rotation pool to manage
+            pool: Optional rotation pool to register immediately
             check_interval: Seconds between refresh checks
             refresh_buffer: Refresh when expiring within this many seconds
 
         """
-        self.pool = pool
+        self._pools: list[RotationPool] = []
+        if pool is not None:
+            self.register(pool)
         self.check_interval = check_interval
         self.refresh_buffer = refresh_buffer
         self._scheduler: Any = None  # AsyncIOScheduler from apscheduler
@@ -70,17 +75,85 @@ class TokenRefreshScheduler:
         self._running = False
         self._initial_check_task: asyncio.Task[None] | None = None
 
-    async def start(self, block_until_initial_refresh: bool = True) -> None:
+    @property
+    def pool(self) -> RotationPool:
+        """Get the first registered pool.
+
+        Raises:
+            RuntimeError: If no pool is registered
+
+        """
+        if not self._pools:
+            raise RuntimeError("No rotation pool registered with refresh scheduler")
+        return self._pools[0]
+
+    @property
+    def pools(self) -> tuple[RotationPool, ...]:
+        """Get all registered pools."""
+        return tuple(self._pools)
+
+    @property
+    def is_running(self) -> bool:
+        """Check if the scheduler is running."""
+        return self._running
+
+    def register(self, pool: RotationPool) -> None:
+        """Register a rotation pool for proactive refresh.
+
+        Args:
+            pool: Rotation pool to manage
+
+        """
+        if pool not in self._pools:
+            self._pools.append(pool)
+
+    def unregister(self, pool: RotationPool) -> None:
+        """Stop managing a rotation pool.
+
+        Args:
+            pool: Rotation pool to remove
+
+        """
+        if pool in self._pools:
+            self._pools.remove(pool)
+
+    def _find_pool(self, account_name: str) -> RotationPool | None:
+        """Find the registered pool that owns an account.
+
+        Args:
+            account_name: Account name to look up
+
+        Returns:
+            Owning pool, or None if no registered pool has the account
+
+        """
+        for pool in self._pools:
+            if pool.get_account(account_name) is not None:
+                return pool
+        return None
+
+    async def start(
+        self,
+        block_until_initial_refresh: bool = True,
+        pool: RotationPool | None = None,
+    ) -> None:
         """Start the refresh scheduler.
 
         Args:
             block_until_initial_refresh: If True, blocks until the initial refresh
                 completes. This prevents race conditions where requests use expired
                 tokens before refresh finishes.
+            pool: Newly registered pool; if the scheduler is already running,
+                only this pool gets its initial refresh
 
         """
         if self._running:
-            logger.warning("refresh_scheduler_already_running")
+            # Shared across pools: a newly registered pool still gets its
+            # initial refresh before requests are served, without re-checking
+            # the pools the running job already covers
+            logger.debug("refresh_scheduler_already_running")
+            if block_until_initial_refresh and pool is not None:
+                await self._check_and_refresh_pool(pool)
             return
 
         self._http_client = httpx.AsyncClient(timeout=DEFAULT_HTTP_TIMEOUT_SECONDS)
@@ -130,10 +203,18 @@ class TokenRefreshScheduler:
         logger.info("token_refresh_scheduler_stopped")
 
     async def _check_and_refresh_all(self) -> None:
-        """Check all accounts and refresh tokens as needed."""
-        accounts = self.pool.get_all_accounts()
+        """Check all accounts of all registered pools and refresh as needed."""
+        for pool in list(self._pools):
+            await self._check_and_refresh_pool(pool)
+
+    async def _check_and_refresh_pool(self, pool: RotationPool) -> None:
+        """Check all accounts of one pool and refresh as needed.
+
+        Args:
+            pool: Rotation pool to check
 
-        for account in accounts:
+        """
+        for account in pool.get_all_accounts():
             # Skip accounts with auth errors (need manual intervention)
             if account.state == "auth_error":
                 continue
@@ -149,20 +230,25 @@ class TokenRefreshScheduler:
                     account=account.name,
                     expires_in=account.credentials.expires_in_seconds,
                 )
-                await self._refresh_with_retry(account.name)
+                await self._refresh_with_retry(account.name, pool=pool)
 
-    async def _refresh_with_retry(self, account_name: str) -> bool:
+    async def _refresh_with_retry(
+        self, account_name: str, pool: RotationPool | None = None
+    ) -> bool:
         """Refresh token with exponential backoff on failure.
 
         Args:
             account_name: Name of account to refresh
+            pool: Pool owning the account (looked up if not given)
 
         Returns:
             True if refresh succeeded
 
         """
-        account = self.pool.get_account(account_name)
-        if not account:
+        if pool is None:
+            pool = self._find_pool(account_name)
+        account = pool.get_account(account_name) if pool else None
+        if pool is None or not account:
             return False
 
         # Mark account as refreshing to prevent concurrent usage
@@ -197,9 +283,7 @@ class TokenRefreshScheduler:
                     )
 
                     # Update account with new credentials
-                    self.pool.update_credentials(
-                        account_name, new_credentials, persist=True
-                    )
+                    pool.update_credentials(account_name, new_credentials, persist=True)
 
                     # Mark refresh complete - this will restore to available
                     account.mark_refresh_complete(success=True)
@@ -223,7 +307,7 @@ class TokenRefreshScheduler:
                     account=account_name,
                     error=str(e),
                 )
-                self.pool.mark_auth_error(
+                pool.mark_auth_error(
                     account_name, "Refresh token expired. Please re-authenticate."
                 )
                 # Mark refresh complete with failure (keeps auth_error state)
@@ -298,7 +382,7 @@ class TokenRefreshScheduler:
         return await self._refresh_with_retry(account_name)
 
 
-# Global scheduler instance
+# Global scheduler instance shared by all pools
 _scheduler: TokenRefreshScheduler | None = None
 
 
@@ -318,15 +402,17 @@ def get_refresh_scheduler() -> TokenRefreshScheduler:
 
 
 def init_refresh_scheduler(pool: RotationPool) -> TokenRefreshScheduler:
-    """Initialize the global refresh scheduler.
+    """Register a pool with the global refresh scheduler, creating it if needed.
 
     Args:
         pool: Rotation pool to manage
 
     Returns:
-        Initialized TokenRefreshScheduler
+        The shared TokenRefreshScheduler
 
     """
     global _scheduler
-    _scheduler = TokenRefreshScheduler(pool)
+    if _scheduler is None:
+        _scheduler = TokenRefreshScheduler()
+    _scheduler.register(pool)
     return _scheduler
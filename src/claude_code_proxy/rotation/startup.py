@@ -188,9 +188,9 @@ async def initialize_refresh_scheduler_startup(
         app.state.refresh_scheduler = None
         return
 
+    scheduler = init_refresh_scheduler(pool)
     try:
-        scheduler = init_refresh_scheduler(pool)
-        await scheduler.start()
+        await scheduler.start(pool=pool)
 
         app.state.refresh_scheduler = scheduler
 
@@ -203,6 +203,9 @@ async def initialize_refresh_scheduler_startup(
             "refresh_scheduler_init_failed",
             error=str(e),
         )
+        # The scheduler is process-wide; drop the pool so it is not kept
+        # registered with no shutdown path to remove it
+        scheduler.unregister(pool)
         app.state.refresh_scheduler = None
 
 
@@ -215,8 +218,13 @@ async def shutdown_refresh_scheduler(app: FastAPI) -> None:
     """
     scheduler = getattr(app.state, "refresh_scheduler", None)
     if scheduler:
-        await scheduler.stop()
-        logger.info("token_refresh_scheduler_stopped")
+        pool = getattr(app.state, "rotation_pool", None)
+        if pool is not None:
+            scheduler.unregister(pool)
+        # The scheduler is shared; only stop it once no pool needs it
+        if not scheduler.pools:
+            await scheduler.stop()
+            logger.info("token_refresh_scheduler_stopped")
 
 
 async def shutdown_rotation_pool(app: FastAPI) -> None:
@@ -258,15 +266,21 @@ async def initialize_file_watcher_startup(app: FastAPI, settings: Settings) -> N
         return
 
     try:
-        accounts_path = get_accounts_path()
+        # Reuse the path the pool was loaded from instead of re-resolving env
+        accounts_path = pool.accounts_path
 
         async def on_reload() -> None:
             """Async callback when accounts file changes.
 
-            Uses pool lock for thread-safe reload.
+            Uses pool lock for thread-safe reload. The stat-based change
+            check runs first without the lock so spurious filesystem events
+            (editor swap files, atomic renames) don't contend with requests.
             """
             try:
-                # Acquire pool lock for thread-safe access
+                if not pool.has_file_changed():
+                    return
+
+                # Acquire pool lock for thread-safe access (re-checks inside)
                 async with pool._lock:
                     if pool.reload_if_changed():
                         logger.info(
@@ -11,11 +11,6 @@ from claude_code_proxy.exceptions import (
 
 from .core import Scheduler
 from .registry import register_task
-from .tasks import (
-    ModelRefreshTask,
-    PoolStatsTask,
-    VersionUpdateCheckTask,
-)
 
 
 logger = structlog.get_logger(__name__)
@@ -99,7 +94,10 @@ async def setup_scheduler_tasks(scheduler: Scheduler, settings: Settings) -> Non
 
 def _register_default_tasks(settings: Settings) -> None:
     """Register default task types in the global registry based on configuration."""
+    # Imported here so the concrete task classes are only resolved when the
+    # scheduler is actually enabled
     from .registry import get_task_registry
+    from .tasks import ModelRefreshTask, PoolStatsTask, VersionUpdateCheckTask
 
     registry = get_task_registry()
 
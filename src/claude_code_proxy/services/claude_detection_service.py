@@ -94,10 +94,10 @@ class ClaudeDetectionService:
                 version_line = result.stdout.strip()
                 if "/" in version_line:
                     # Handle "claude-cli/1.0.60" format
-                    version_line = version_line.split("/")[-1]
+                    version_line = version_line.rpartition("/")[2]
                 if "(" in version_line:
                     # Handle "1.0.60 (Claude Code)" format - extract just the version number
-                    return version_line.split("(")[0].strip()
+                    return version_line.partition("(")[0].strip()
                 return version_line
             raise RuntimeError(f"Claude version command failed: {result.stderr}")
 
@@ -239,7 +239,7 @@ class ClaudeDetectionService:
     def _extract_system_prompt(self, body: bytes) -> SystemPromptData:
         """Extract system prompt from captured request body."""
         try:
-            data = orjson.loads(body.decode("utf-8"))
+            data = orjson.loads(body)
             system_content = data.get("system")
 
             if system_content is None:
@@ -247,9 +247,8 @@ class ClaudeDetectionService:
 
             return SystemPromptData(system_field=system_content)
 
-        except (orjson.JSONDecodeError, UnicodeDecodeError, ValueError, KeyError) as e:
-            # JSONDecodeError: Invalid JSON body
-            # UnicodeDecodeError: Body encoding issues
+        except (orjson.JSONDecodeError, ValueError, KeyError) as e:
+            # JSONDecodeError: Invalid JSON body or invalid UTF-8
             # ValueError: Missing system field or validation errors
             # KeyError: Missing expected fields
             logger.exception("system_prompt_extraction_failed", error=str(e))
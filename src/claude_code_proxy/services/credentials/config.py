@@ -12,22 +12,28 @@ if TYPE_CHECKING:
     from claude_code_proxy.config.auth import OAuthSettings
 
 
-def _get_default_storage_paths() -> list[str]:
-    """Get default storage paths, with test override support."""
-    # Allow tests to override credential paths
-    if os.getenv("CCPROXY_TEST_MODE") == "true":
-        # Use a test-specific location that won't pollute real credentials
-        # nosec B108 - test mode paths intentionally use /tmp for isolation
-        return [
-            "/tmp/claude-code-proxy-test/.config/claude/.credentials.json",  # nosec B108
-            "/tmp/claude-code-proxy-test/.claude/.credentials.json",  # nosec B108
-        ]
-
-    return [
+# Allow tests to override credential paths; read once since the process
+# environment does not switch modes at runtime
+_TEST_MODE = os.getenv("CCPROXY_TEST_MODE") == "true"
+
+if _TEST_MODE:
+    # Use a test-specific location that won't pollute real credentials
+    # nosec B108 - test mode paths intentionally use /tmp for isolation
+    _DEFAULT_STORAGE_PATHS: tuple[str, ...] = (
+        "/tmp/claude-code-proxy-test/.config/claude/.credentials.json",  # nosec B108
+        "/tmp/claude-code-proxy-test/.claude/.credentials.json",  # nosec B108
+    )
+else:
+    _DEFAULT_STORAGE_PATHS = (
         "~/.config/claude/.credentials.json",  # Alternative legacy location
         "~/.claude/.credentials.json",  # Legacy location
         "~/.config/claude-code-proxy/credentials.json",  # location in app config
-    ]
+    )
+
+
+def _get_default_storage_paths() -> list[str]:
+    """Get default storage paths, with test override support."""
+    return list(_DEFAULT_STORAGE_PATHS)
 
 
 def _get_oauth_settings() -> OAuthSettings:
@@ -60,12 +66,8 @@ class OAuthConfig(BaseModel):
         default="https://console.anthropic.com/oauth/native/callback",
         description="OAuth redirect URI",
     )
-    scopes: list[str] = Field(
-        default_factory=lambda: [
-            "org:create_api_key",
-            "user:profile",
-            "user:inference",
-        ],
+    scopes: tuple[str, ...] = Field(
+        default=("org:create_api_key", "user:profile", "user:inference"),
         description="OAuth scopes to request",
     )
 
@@ -74,7 +76,7 @@ class CredentialsConfig(BaseModel):
     """Configuration for credentials management."""
 
     storage_paths: list[str] = Field(
-        default_factory=lambda: _get_default_storage_paths(),
+        default_factory=_get_default_storage_paths,
         description="Paths to search for credentials files",
     )
     oauth: OAuthConfig = Field(
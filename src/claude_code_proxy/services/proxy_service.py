@@ -1,17 +1,16 @@
 """Proxy service for orchestrating Claude API requests with business logic."""
 
+import asyncio
 import os
 import time
-from pathlib import Path
+from functools import cache
 from typing import Any
 
 import httpx
 import orjson
-import shortuuid
 import structlog
 from fastapi import Request
 from fastapi.responses import StreamingResponse
-from typing_extensions import TypedDict
 
 from claude_code_proxy.adapters.openai import OpenAIAdapter
 from claude_code_proxy.config.settings import Settings
@@ -19,36 +18,44 @@ from claude_code_proxy.core.http import BaseProxyClient
 from claude_code_proxy.core.http_transformers import (
     HTTPRequestTransformer,
     HTTPResponseTransformer,
+    ResponseData,
 )
+from claude_code_proxy.core.logging import is_debug_enabled
 from claude_code_proxy.core.request_context import RequestContext
 from claude_code_proxy.services.credentials.manager import CredentialsManager
 from claude_code_proxy.services.request_metadata import (
     extract_metadata,
     is_streaming_request,
+    parse_request_body,
 )
 from claude_code_proxy.services.streaming_handler import StreamingHandler
 from claude_code_proxy.services.token_provider import TokenProvider
 from claude_code_proxy.services.verbose_logger import VerboseLogger
+from claude_code_proxy.utils.id_generator import generate_request_id
 
 
-class RequestData(TypedDict):
-    """Typed structure for transformed request data."""
+logger = structlog.get_logger(__name__)
 
-    method: str
-    url: str
-    headers: dict[str, str]
-    body: bytes | None
+# Methods whose request bodies carry the model and stream flag
+_JSON_BODY_METHODS = frozenset({"POST", "PUT", "PATCH"})
 
 
-class ResponseData(TypedDict):
-    """Typed structure for transformed response data."""
+@cache
+def _verbose_logging_flags() -> tuple[bool, bool]:
+    """Read the verbose logging switches from the environment.
 
-    status_code: int
-    headers: dict[str, str]
-    body: bytes
+    A ProxyService is built for every request, so the environment is only
+    read the first time.
 
+    Returns:
+        Tuple of (verbose_api, verbose_streaming)
 
-logger = structlog.get_logger(__name__)
+    """
+    verbose_api = os.environ.get("CCPROXY_VERBOSE_API", "false").lower() == "true"
+    verbose_streaming = (
+        os.environ.get("CCPROXY_VERBOSE_STREAMING", "false").lower() == "true"
+    )
+    return verbose_api, verbose_streaming
 
 
 class ProxyService:
@@ -70,6 +77,7 @@ class ProxyService:
         proxy_mode: str = "full",
         target_base_url: str = "https://api.anthropic.com",
         app_state: Any = None,
+        owns_proxy_client: bool = True,
     ) -> None:
         """Initialize the proxy service.
 
@@ -80,9 +88,12 @@ class ProxyService:
             proxy_mode: Transformation mode - "minimal" or "full"
             target_base_url: Base URL for the target API
             app_state: FastAPI app state for accessing detection data
+            owns_proxy_client: Whether close() should close proxy_client; False
+                when it wraps the app-wide HTTP client closed on shutdown
 
         """
         self.proxy_client = proxy_client
+        self.owns_proxy_client = owns_proxy_client
         self.credentials_manager = credentials_manager
         self.settings = settings
         self.proxy_mode = proxy_mode
@@ -96,15 +107,8 @@ class ProxyService:
         # Initialize OpenAI adapter for format conversion
         self.openai_adapter = OpenAIAdapter()
 
-        # Cache environment-based configuration
-        self._proxy_url = self._init_proxy_url()
-        self._ssl_context = self._init_ssl_context()
-
         # Initialize verbose logger
-        verbose_streaming = (
-            os.environ.get("CCPROXY_VERBOSE_STREAMING", "false").lower() == "true"
-        )
-        verbose_api = os.environ.get("CCPROXY_VERBOSE_API", "false").lower() == "true"
+        verbose_api, verbose_streaming = _verbose_logging_flags()
         self.verbose_logger = VerboseLogger(
             verbose_api=verbose_api,
             verbose_streaming=verbose_streaming,
@@ -118,45 +122,10 @@ class ProxyService:
             response_transformer=self.response_transformer,
             openai_adapter=self.openai_adapter,
             verbose_logger=self.verbose_logger,
-            proxy_url=self._proxy_url,
-            ssl_context=self._ssl_context,
+            http_client=proxy_client.http_client,
             proxy_mode=self.proxy_mode,
         )
 
-    def _init_proxy_url(self) -> str | None:
-        """Initialize proxy URL from environment variables."""
-        # Check for standard proxy environment variables
-        # For HTTPS requests, prioritize HTTPS_PROXY
-        https_proxy = os.environ.get("HTTPS_PROXY") or os.environ.get("https_proxy")
-        all_proxy = os.environ.get("ALL_PROXY")
-        http_proxy = os.environ.get("HTTP_PROXY") or os.environ.get("http_proxy")
-
-        proxy_url = https_proxy or all_proxy or http_proxy
-
-        if proxy_url:
-            logger.debug("proxy_configured", proxy_url=proxy_url)
-
-        return proxy_url
-
-    def _init_ssl_context(self) -> str | bool:
-        """Initialize SSL context configuration from environment variables."""
-        # Check for custom CA bundle
-        ca_bundle = os.environ.get("REQUESTS_CA_BUNDLE") or os.environ.get(
-            "SSL_CERT_FILE"
-        )
-
-        # Check if SSL verification should be disabled (NOT RECOMMENDED)
-        ssl_verify = os.environ.get("SSL_VERIFY", "true").lower()
-
-        if ca_bundle and Path(ca_bundle).exists():
-            logger.info("ca_bundle_configured", ca_bundle=ca_bundle)
-            return ca_bundle
-        if ssl_verify in ("false", "0", "no"):
-            logger.warning("ssl_verification_disabled")
-            return False
-        logger.debug("ssl_verification_default")
-        return True
-
     async def handle_request(
         self,
         method: str,
@@ -185,46 +154,79 @@ class ProxyService:
             HTTPException: If request fails
 
         """
-        # Extract request metadata
-        model, streaming = extract_metadata(body)
-
-        # Use existing context from request if available, otherwise create new one
-        if request and hasattr(request, "state") and hasattr(request.state, "context"):
-            ctx = request.state.context
+        # Parse the body once; metadata is read from it and the same dict is
+        # handed to the request transformer. Only methods that carry a JSON
+        # body are parsed
+        if body and method in _JSON_BODY_METHODS:
+            body_data = parse_request_body(body)
+            model, streaming = extract_metadata(body_data)
         else:
+            body_data, model, streaming = None, None, False
+
+        # Use existing context from request if available, otherwise create new
+        # one already holding the request metadata
+        metadata: dict[str, Any] = {"model": model, "streaming": bool(streaming)}
+        ctx: RequestContext | None = (
+            getattr(request.state, "context", None) if request is not None else None
+        )
+        if ctx is None:
             ctx = RequestContext(
-                request_id=shortuuid.uuid(),
+                request_id=generate_request_id(),
                 method=method,
                 path=path,
+                metadata=metadata,
             )
+        else:
+            ctx.add_metadata(**metadata)
+
+        # Bind the request fields once so every event below carries them
+        log = logger.bind(request_id=ctx.request_id, method=method, path=path)
+
+        # Check the level once so disabled debug events never build their
+        # event dicts or run the processor chain
+        debug_enabled = is_debug_enabled(__name__)
 
         try:
-            # 1. Authentication - get access token
-            logger.debug("oauth_token_retrieval_start")
-            access_token = await self.token_provider.get_token(request)
+            # 1. Authentication - a rotation token is already on the request;
+            # otherwise the credentials lookup may read storage or refresh
+            access_token = self.token_provider.get_request_token(request)
 
             # 2. Request transformation
             injection_mode = self.settings.claude.system_prompt_injection_mode.value
-            logger.debug(
-                "request_transform_start",
-                system_prompt_injection_mode=injection_mode,
-            )
-            transformed_request = (
-                await self.request_transformer.transform_proxy_request(
-                    method,
-                    path,
-                    headers,
-                    body,
-                    query_params,
-                    access_token,
-                    self.target_base_url,
-                    self.app_state,
-                    injection_mode,
+            if debug_enabled:
+                log.debug(
+                    "request_transform_start",
+                    system_prompt_injection_mode=injection_mode,
                 )
+            transform = self.request_transformer.transform_proxy_request(
+                method,
+                path,
+                headers,
+                body,
+                query_params,
+                access_token or "",
+                self.target_base_url,
+                self.app_state,
+                injection_mode,
+                parsed_body=body_data,
             )
+            if access_token:
+                transformed_request = await transform
+            else:
+                if debug_enabled:
+                    log.debug("oauth_token_retrieval_start")
+                # Start the token lookup first so the transform runs while it
+                # waits on I/O, then authorize the transformed request
+                fetched_token, transformed_request = await asyncio.gather(
+                    self.token_provider.get_token(request), transform
+                )
+                self.request_transformer.apply_access_token(
+                    transformed_request["headers"], fetched_token
+                )
 
             # 3. Forward request using proxy client
-            logger.debug("request_forwarding_start", url=transformed_request["url"])
+            if debug_enabled:
+                log.debug("request_forwarding_start", url=transformed_request["url"])
 
             # Check if this will be a streaming response
             should_stream = streaming or is_streaming_request(
@@ -232,17 +234,21 @@ class ProxyService:
             )
 
             if should_stream:
-                logger.debug("streaming_response_detected")
+                if debug_enabled:
+                    log.debug("streaming_response_detected")
                 return await self.streaming.handle(
                     transformed_request, path, timeout, ctx
                 )
-            logger.debug("non_streaming_response_detected")
+            if debug_enabled:
+                log.debug("non_streaming_response_detected")
 
             # Log the outgoing request if verbose API logging is enabled
-            await self.verbose_logger.log_api_request(transformed_request, ctx)
+            verbose_api = self.verbose_logger.verbose_api
+            if verbose_api:
+                await self.verbose_logger.log_api_request(transformed_request, ctx)
 
             # Handle regular request
-            start_time = time.perf_counter()
+            start_ns = time.monotonic_ns() if debug_enabled else 0
 
             (
                 status_code,
@@ -256,64 +262,68 @@ class ProxyService:
                 timeout=timeout,
             )
 
-            end_time = time.perf_counter()
-            api_duration = end_time - start_time
-            logger.debug("api_call_completed", duration_seconds=api_duration)
+            if debug_enabled:
+                log.debug(
+                    "api_call_completed",
+                    duration_seconds=(time.monotonic_ns() - start_ns) / 1e9,
+                )
 
             # Log the received response if verbose API logging is enabled
-            await self.verbose_logger.log_api_response(
-                status_code, response_headers, response_body, ctx
-            )
+            if verbose_api:
+                await self.verbose_logger.log_api_response(
+                    status_code, response_headers, response_body, ctx
+                )
 
             # 4. Response transformation
-            logger.debug("response_transform_start")
-            # For error responses, transform to OpenAI format if needed
-            transformed_response: ResponseData
-            if status_code >= 400:
-                logger.info(
+            if debug_enabled:
+                log.debug("response_transform_start")
+            is_error = status_code >= 400
+            if is_error:
+                content_length = len(response_body) if response_body else 0
+                log.info(
                     "upstream_error_received",
                     status_code=status_code,
-                    has_body=bool(response_body),
-                    content_length=len(response_body) if response_body else 0,
+                    has_body=content_length > 0,
+                    content_length=content_length,
                 )
 
-                # Use transformer to handle error transformation (including OpenAI format)
-                transformed_response = (
-                    await self.response_transformer.transform_proxy_response(
-                        status_code,
-                        response_headers,
-                        response_body,
-                        path,
-                        self.proxy_mode,
-                    )
-                )
-            else:
-                transformed_response = (
-                    await self.response_transformer.transform_proxy_response(
-                        status_code,
-                        response_headers,
-                        response_body,
-                        path,
-                        self.proxy_mode,
-                    )
+            # The transformer also converts error bodies to OpenAI format if needed
+            transformed_response: ResponseData = (
+                self.response_transformer.transform_proxy_response(
+                    status_code,
+                    response_headers,
+                    response_body,
+                    path,
+                    self.proxy_mode,
                 )
+            )
 
-            # 5. Extract response metrics using direct JSON parsing
-            if transformed_response["body"]:
+            # 5. Extract response metrics using direct JSON parsing. The usage
+            # only feeds a debug event, and only lives in successful JSON
+            # objects, so skip bodies that cannot hold it rather than relying
+            # on the parse to fail
+            if (
+                debug_enabled
+                and not is_error
+                and transformed_response["body"][:1] == b"{"
+                and response_headers.get("content-type", "").startswith(
+                    "application/json"
+                )
+            ):
                 try:
-                    response_data = orjson.loads(
-                        transformed_response["body"].decode("utf-8")
-                    )
+                    # orjson parses bytes directly, no intermediate str copy
+                    response_data = orjson.loads(transformed_response["body"])
                     usage = response_data.get("usage", {})
                     tokens_input = usage.get("input_tokens")
                     tokens_output = usage.get("output_tokens")
                     if tokens_input or tokens_output:
-                        logger.debug(
+                        log.debug(
                             "token_usage",
                             input=tokens_input,
                             output=tokens_output,
                         )
-                except (orjson.JSONDecodeError, UnicodeDecodeError):
+                except orjson.JSONDecodeError:
+                    # Also raised for invalid UTF-8
                     pass
 
             return (
@@ -330,12 +340,12 @@ class ProxyService:
             RuntimeError,
         ) as e:
             # HTTP transport errors, JSON parsing errors, or runtime issues
-            logger.exception("proxy_request_error", error=str(e))
+            log.exception("proxy_request_error", error=str(e))
             raise
 
     async def close(self) -> None:
         """Close any resources held by the proxy service."""
-        if self.proxy_client:
+        if self.proxy_client and self.owns_proxy_client:
             await self.proxy_client.close()
         if self.credentials_manager:
             await self.credentials_manager.__aexit__(None, None, None)
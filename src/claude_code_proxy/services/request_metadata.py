@@ -4,68 +4,97 @@ This module provides stateless helper functions for extracting and transforming
 request metadata. All functions are pure with no side effects.
 """
 
+from typing import Any
+
 import orjson
 import structlog
 
+from claude_code_proxy.core.logging import is_debug_enabled
+
 
 logger = structlog.get_logger(__name__)
 
 # Sensitive headers that should be redacted in logs
 SENSITIVE_HEADERS = frozenset({"authorization", "x-api-key", "cookie", "set-cookie"})
+# Lengths of the sensitive names; most headers fail this check without being
+# lowercased
+_SENSITIVE_HEADER_LENGTHS = frozenset(len(name) for name in SENSITIVE_HEADERS)
 
 
-def extract_metadata(body: bytes | None) -> tuple[str | None, bool]:
-    """Extract model and streaming flag from request body.
+def parse_request_body(body: bytes | None) -> dict[str, Any] | None:
+    """Parse a JSON request body into a dict.
 
     Args:
         body: Request body bytes
 
     Returns:
-        Tuple of (model, streaming)
+        Parsed body, or None if the body is empty, not JSON, or not an object
 
     """
     if not body:
-        return None, False
+        return None
 
     try:
         body_data = orjson.loads(body)
-        model = body_data.get("model")
-        streaming = body_data.get("stream", False)
-        return model, streaming
-    except (ValueError, UnicodeDecodeError):
+    except orjson.JSONDecodeError:
+        return None
+    return body_data if isinstance(body_data, dict) else None
+
+
+def _as_body_data(body: bytes | dict[str, Any] | None) -> dict[str, Any] | None:
+    """Return the parsed body, parsing only if raw bytes were given."""
+    if isinstance(body, dict):
+        return body
+    return parse_request_body(body)
+
+
+def extract_metadata(
+    body: bytes | dict[str, Any] | None,
+) -> tuple[str | None, bool]:
+    """Extract model and streaming flag from request body.
+
+    Args:
+        body: Request body bytes, or the body already parsed with
+            parse_request_body
+
+    Returns:
+        Tuple of (model, streaming)
+
+    """
+    body_data = _as_body_data(body)
+    if body_data is None:
         return None, False
+    return body_data.get("model"), body_data.get("stream", False)
 
 
-def extract_message_type(body: bytes | None) -> str:
+def extract_message_type(body: bytes | dict[str, Any] | None) -> str:
     """Extract message type from request body for realistic response generation.
 
     Args:
-        body: Request body bytes
+        body: Request body bytes, or the body already parsed with
+            parse_request_body
 
     Returns:
         Message type: "tool_use", "long", "medium", or "short"
 
     """
-    if not body:
+    body_data = _as_body_data(body)
+    if body_data is None:
         return "short"
 
-    try:
-        body_data = orjson.loads(body)
-        # Check if tools are present - indicates tool use
-        if body_data.get("tools"):
-            return "tool_use"
-
-        # Check message content length to determine type
-        messages = body_data.get("messages", [])
-        if messages:
-            content = str(messages[-1].get("content", ""))
-            if len(content) > 200:
-                return "long"
-            if len(content) < 50:
-                return "short"
-            return "medium"
-    except (ValueError, UnicodeDecodeError):
-        pass
+    # Check if tools are present - indicates tool use
+    if body_data.get("tools"):
+        return "tool_use"
+
+    # Check message content length to determine type
+    messages = body_data.get("messages", [])
+    if messages:
+        content = str(messages[-1].get("content", ""))
+        if len(content) > 200:
+            return "long"
+        if len(content) < 50:
+            return "short"
+        return "medium"
 
     return "short"
 
@@ -80,14 +109,16 @@ def is_streaming_request(headers: dict[str, str]) -> bool:
         True if response should be streamed
 
     """
-    # Check if client requested streaming
-    accept_header = headers.get("accept", "").lower()
-    should_stream = "text/event-stream" in accept_header or "stream" in accept_header
-    logger.debug(
-        "stream_check_completed",
-        accept_header=accept_header,
-        should_stream=should_stream,
-    )
+    # Check if client requested streaming; "stream" also covers
+    # "text/event-stream", so one scan is enough
+    accept_header = headers.get("accept", "")
+    should_stream = "stream" in accept_header.lower()
+    if is_debug_enabled(__name__):
+        logger.debug(
+            "stream_check_completed",
+            accept_header=accept_header,
+            should_stream=should_stream,
+        )
     return should_stream
 
 
@@ -101,7 +132,8 @@ def redact_sensitive_headers(headers: dict[str, str]) -> dict[str, str]:
         Headers dictionary with sensitive values redacted
 
     """
-    return {
-        k: "[REDACTED]" if k.lower() in SENSITIVE_HEADERS else v
-        for k, v in headers.items()
-    }
+    redacted = dict(headers)
+    for key in headers:
+        if len(key) in _SENSITIVE_HEADER_LENGTHS and key.lower() in SENSITIVE_HEADERS:
+            redacted[key] = "[REDACTED]"
+    return redacted
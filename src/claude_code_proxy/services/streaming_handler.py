@@ -8,28 +8,123 @@ This module handles streaming request processing, including:
 from __future__ import annotations
 
 import asyncio
-from collections.abc import AsyncGenerator
+from collections.abc import AsyncGenerator, AsyncIterator
+from contextlib import AsyncExitStack
 from typing import TYPE_CHECKING, Any
 
 import httpx
 import orjson
 import structlog
 from fastapi.responses import StreamingResponse
-from httpx_sse import EventSource
+from starlette.background import BackgroundTask
 
+from claude_code_proxy.core.logging import is_debug_enabled, is_info_enabled
 from claude_code_proxy.core.request_context import RequestContext
 from claude_code_proxy.services.request_metadata import redact_sensitive_headers
-from claude_code_proxy.utils.simple_request_logger import append_streaming_log
+from claude_code_proxy.utils.simple_request_logger import (
+    append_streaming_log,
+    should_log_requests,
+)
+from claude_code_proxy.utils.streaming_metrics import StreamingMetricsCollector
 
 
 if TYPE_CHECKING:
     from claude_code_proxy.adapters.openai.adapter import OpenAIAdapter
-    from claude_code_proxy.core.http_transformers import HTTPResponseTransformer
-    from claude_code_proxy.services.proxy_service import RequestData
+    from claude_code_proxy.core.http import HTTPClient
+    from claude_code_proxy.core.http_transformers import (
+        HTTPResponseTransformer,
+        RequestData,
+    )
     from claude_code_proxy.services.verbose_logger import VerboseLogger
 
 logger = structlog.get_logger(__name__)
 
+# Upstream headers that do not describe the re-streamed body
+_STREAMING_DROP_HEADERS = frozenset(
+    {"date", "content-length", "content-encoding", "transfer-encoding"}
+)
+# Headers forced on every streaming response
+_STREAMING_HEADER_OVERRIDES = {"cache-control": "no-cache", "connection": "keep-alive"}
+# SSE framing around each serialized data payload
+_SSE_DATA_PREFIX = b"data: "
+_SSE_EVENT_END = b"\n\n"
+# Verbose response logs written after the response is returned; referenced
+# here so the tasks are not garbage collected while running (RUF006)
+_response_log_tasks: set[asyncio.Task[None]] = set()
+
+
+def _aiter_upstream_chunks(response: httpx.Response) -> AsyncIterator[bytes]:
+    """Iterate the upstream body with as little re-chunking as possible.
+
+    Args:
+        response: Open upstream streaming response
+
+    Returns:
+        Async iterator over body chunks
+
+    """
+    # Identity-encoded streams are forwarded verbatim, so skip httpx's
+    # decoder and chunker; compressed streams still need decoding
+    if response.headers.get("content-encoding", "identity") == "identity":
+        return response.aiter_raw()
+    return response.aiter_bytes()
+
+
+async def _aiter_sse_data(chunks: AsyncIterator[bytes]) -> AsyncGenerator[bytes, None]:
+    """Split an SSE byte stream into the data payload of each event.
+
+    Lines are matched as bytes and never decoded; LF, CRLF and bare CR all end
+    a line, and a ``data`` line without a colon is an empty data value. A line
+    cut across chunks is kept as a list of fragments and joined once its
+    line ending arrives, so fragmented streams are not re-concatenated per
+    chunk. A trailing event without its terminating blank line is dropped, as
+    the SSE spec requires.
+
+    Args:
+        chunks: Raw SSE body chunks
+
+    Yields:
+        Data payload of each event that has one
+
+    """
+    pending: list[bytes] = []
+    data_lines: list[bytes] = []
+    # Set when a chunk ended in CR, so a LF opening the next chunk is read as
+    # the rest of that CRLF rather than as a blank line
+    skip_lf = False
+    async for chunk in chunks:
+        if skip_lf:
+            skip_lf = False
+            if chunk[:1] == b"\n":
+                chunk = chunk[1:]
+        end = max(chunk.rfind(b"\n"), chunk.rfind(b"\r"))
+        if end == -1:
+            if chunk:
+                pending.append(chunk)
+            continue
+        if pending:
+            pending.append(chunk)
+            joined = b"".join(pending)
+            end += len(joined) - len(chunk)
+            chunk = joined
+            pending = []
+        if end + 1 < len(chunk):
+            pending.append(chunk[end + 1 :])
+        else:
+            skip_lf = chunk[end:] == b"\r"
+
+        for line in chunk[: end + 1].splitlines():
+            if not line:
+                # A blank line dispatches the event
+                if data_lines:
+                    yield b"\n".join(data_lines)
+                    data_lines.clear()
+            elif line.startswith(b"data:"):
+                value = line[5:]
+                data_lines.append(value[1:] if value[:1] == b" " else value)
+            elif line == b"data":
+                data_lines.append(b"")
+
 
 class StreamingHandler:
     """Handles streaming request processing with format transformation.
@@ -43,8 +138,7 @@ class StreamingHandler:
         response_transformer: HTTPResponseTransformer,
         openai_adapter: OpenAIAdapter,
         verbose_logger: VerboseLogger,
-        proxy_url: str | None,
-        ssl_context: Any,
+        http_client: HTTPClient,
         proxy_mode: str,
     ) -> None:
         """Initialize the streaming handler.
@@ -53,16 +147,14 @@ class StreamingHandler:
             response_transformer: Transformer for response formats
             openai_adapter: Adapter for OpenAI format transformation
             verbose_logger: Logger for verbose output
-            proxy_url: Optional proxy URL for requests
-            ssl_context: SSL context for verification
+            http_client: Shared HTTP client used for upstream requests
             proxy_mode: Current proxy operation mode
 
         """
         self.response_transformer = response_transformer
         self.openai_adapter = openai_adapter
         self.verbose_logger = verbose_logger
-        self.proxy_url = proxy_url
-        self.ssl_context = ssl_context
+        self.http_client = http_client
         self.proxy_mode = proxy_mode
 
     async def handle(
@@ -87,19 +179,17 @@ class StreamingHandler:
         # Log the outgoing request if verbose API logging is enabled
         await self.verbose_logger.log_api_request(request_data, ctx)
 
-        # First, make the request and check for errors before streaming
-        async with httpx.AsyncClient(
-            timeout=timeout, proxy=self.proxy_url, verify=self.ssl_context
-        ) as client:
-            # Start the request to get headers
-            response = await client.send(
-                client.build_request(
+        # Open the upstream stream once; the status line is available before
+        # any body is read, so errors are detected without a second request
+        async with AsyncExitStack() as exit_stack:
+            response = await exit_stack.enter_async_context(
+                await self.http_client.stream(
                     method=request_data["method"],
                     url=request_data["url"],
                     headers=request_data["headers"],
                     content=request_data["body"],
-                ),
-                stream=True,
+                    timeout=timeout,
+                )
             )
 
             # Check for errors before starting to stream
@@ -108,9 +198,63 @@ class StreamingHandler:
                     response, request_data, original_path, ctx
                 )
 
-        # If no error, proceed with streaming
-        return await self._create_streaming_response(
-            request_data, original_path, timeout, ctx
+            # A JSON body instead of SSE has nothing to stream; read it in one
+            # go rather than pushing it through the chunk loop
+            if response.headers.get("content-type", "").startswith("application/json"):
+                return await self._handle_buffered_response(
+                    response, original_path, ctx
+                )
+
+            # Hand ownership of the open response to the stream generator
+            stream_stack = exit_stack.pop_all()
+
+        # If no error, proceed with streaming; the path is classified once
+        # here and the result passed down to the stream generator
+        is_openai = self.response_transformer._is_openai_request(original_path)
+        return self._create_streaming_response(
+            response, stream_stack, request_data, original_path, is_openai, ctx
+        )
+
+    async def _handle_buffered_response(
+        self,
+        response: httpx.Response,
+        original_path: str,
+        ctx: RequestContext,
+    ) -> tuple[int, dict[str, str], bytes]:
+        """Handle a successful upstream response that is not an event stream.
+
+        Args:
+            response: Non-SSE response from upstream
+            original_path: Original request path
+            ctx: Request context
+
+        Returns:
+            Tuple of (status_code, headers, body)
+
+        """
+        content = await response.aread()
+        response_headers = dict(response.headers)
+
+        self._log_api_response_in_background(
+            response.status_code, response_headers, content, ctx
+        )
+        logger.debug(
+            "non_sse_stream_response_buffered",
+            status_code=response.status_code,
+            content_length=len(content),
+        )
+
+        transformed_response = self.response_transformer.transform_proxy_response(
+            response.status_code,
+            response_headers,
+            content,
+            original_path,
+            self.proxy_mode,
+        )
+        return (
+            transformed_response["status_code"],
+            transformed_response["headers"],
+            transformed_response["body"],
         )
 
     async def _handle_error_response(
@@ -133,107 +277,127 @@ class StreamingHandler:
 
         """
         error_content = await response.aread()
+        # Snapshot headers once; the same dict is logged, transformed and returned
+        response_headers = dict(response.headers)
 
         # Log the full error response body
-        await self.verbose_logger.log_api_response(
-            response.status_code, dict(response.headers), error_content, ctx
+        self._log_api_response_in_background(
+            response.status_code, response_headers, error_content, ctx
         )
 
-        logger.info(
-            "streaming_error_received",
-            status_code=response.status_code,
-            error_detail=error_content.decode("utf-8", errors="replace"),
-        )
+        # Only decode the error body when the event is actually emitted
+        if is_info_enabled(__name__):
+            logger.info(
+                "streaming_error_received",
+                status_code=response.status_code,
+                error_detail=error_content.decode("utf-8", errors="replace"),
+            )
 
         # Use transformer to handle error transformation (including OpenAI format)
-        transformed_error_response = (
-            await self.response_transformer.transform_proxy_response(
-                response.status_code,
-                dict(response.headers),
-                error_content,
-                original_path,
-                self.proxy_mode,
-            )
+        transformed_error_response = self.response_transformer.transform_proxy_response(
+            response.status_code,
+            response_headers,
+            error_content,
+            original_path,
+            self.proxy_mode,
         )
         transformed_error_body = transformed_error_response["body"]
 
         # Return error as regular response
         return (
             response.status_code,
-            dict(response.headers),
+            response_headers,
             transformed_error_body,
         )
 
-    async def _create_streaming_response(
+    def _log_api_response_in_background(
+        self,
+        status_code: int,
+        headers: dict[str, str],
+        body: bytes,
+        ctx: RequestContext,
+    ) -> None:
+        """Write the verbose response log without delaying the response.
+
+        Args:
+            status_code: HTTP status code
+            headers: Response headers
+            body: Response body bytes
+            ctx: Request context
+
+        """
+        if not self.verbose_logger.verbose_api:
+            return
+
+        task = asyncio.create_task(
+            self.verbose_logger.log_api_response(status_code, headers, body, ctx)
+        )
+        _response_log_tasks.add(task)
+        task.add_done_callback(_response_log_tasks.discard)
+
+    def _create_streaming_response(
         self,
+        response: httpx.Response,
+        stream_stack: AsyncExitStack,
         request_data: RequestData,
         original_path: str,
-        timeout: float,
+        is_openai: bool,
         ctx: RequestContext,
     ) -> StreamingResponse:
         """Create a streaming response with proper headers and generator.
 
         Args:
+            response: Open upstream streaming response
+            stream_stack: Exit stack that closes the upstream response
             request_data: Request data for upstream
             original_path: Original request path
-            timeout: Request timeout
+            is_openai: Whether the stream is converted to OpenAI format
             ctx: Request context
 
         Returns:
             StreamingResponse with content generator
 
         """
-        response_headers: dict[str, str] = {}
-        response_status = 200
-
-        # Make initial request to capture headers
-        async with httpx.AsyncClient(
-            timeout=timeout, proxy=self.proxy_url, verify=self.ssl_context
-        ) as client:
-            initial_response = await client.send(
-                client.build_request(
-                    method=request_data["method"],
-                    url=request_data["url"],
-                    headers=request_data["headers"],
-                    content=request_data["body"],
-                ),
-                stream=True,
-            )
-            response_status = initial_response.status_code
-            response_headers = dict(initial_response.headers)
-
-            # Close the initial response since we'll make a new one in the generator
-            await initial_response.aclose()
+        response_status = response.status_code
+        response_headers = dict(response.headers)
 
         # Create stream generator with all required context
         generator = self._create_stream_generator(
+            response,
+            stream_stack,
             request_data,
             original_path,
-            timeout,
+            is_openai,
             ctx,
             response_status,
             response_headers,
         )
 
-        # Build final headers
-        final_headers = response_headers.copy()
-        final_headers.pop("date", None)  # Remove upstream date header
-        final_headers["Cache-Control"] = "no-cache"
-        final_headers["Connection"] = "keep-alive"
-        if "content-type" not in final_headers:
-            final_headers["content-type"] = "text/event-stream"
+        # Build final headers (httpx header keys are already lowercase)
+        final_headers = {
+            key: value
+            for key, value in response_headers.items()
+            if key not in _STREAMING_DROP_HEADERS
+        }
+        final_headers.update(_STREAMING_HEADER_OVERRIDES)
+        final_headers.setdefault("content-type", "text/event-stream")
 
         return StreamingResponse(
             content=generator,
             status_code=response_status,
             headers=final_headers,
+            # Also release the upstream connection if the client disconnects
+            # before the generator runs to completion
+            background=BackgroundTask(stream_stack.aclose),
         )
 
     def _create_stream_generator(
         self,
+        response: httpx.Response,
+        stream_stack: AsyncExitStack,
         request_data: RequestData,
         original_path: str,
-        timeout: float,
+        is_openai: bool,
         ctx: RequestContext,
         response_status: int,
         response_headers: dict[str, str],
@@ -241,81 +405,66 @@ class StreamingHandler:
         """Create the async generator for streaming content.
 
         Args:
+            response: Open upstream streaming response
+            stream_stack: Exit stack that closes the upstream response
             request_data: Request data for upstream
             original_path: Original request path
-            timeout: Request timeout
+            is_openai: Whether the stream is converted to OpenAI format
             ctx: Request context
-            response_status: Initial response status
-            response_headers: Initial response headers
+            response_status: Upstream response status
+            response_headers: Snapshot of the upstream response headers
 
         Returns:
             Async generator yielding stream chunks
 
         """
         # Initialize streaming metrics collector
-        from claude_code_proxy.utils.streaming_metrics import StreamingMetricsCollector
-
         metrics_collector = StreamingMetricsCollector(request_id=ctx.request_id)
 
         async def stream_generator() -> AsyncGenerator[bytes, None]:
-            nonlocal response_status, response_headers
-
+            # Check the level once so disabled debug events never build their
+            # event dicts
+            debug_enabled = is_debug_enabled(__name__)
             try:
-                logger.debug(
-                    "stream_generator_start",
-                    method=request_data["method"],
-                    url=request_data["url"],
-                    headers=request_data["headers"],
-                )
-
-                async with (
-                    httpx.AsyncClient(
-                        timeout=timeout, proxy=self.proxy_url, verify=self.ssl_context
-                    ) as client,
-                    client.stream(
+                if debug_enabled:
+                    logger.debug(
+                        "stream_generator_start",
                         method=request_data["method"],
                         url=request_data["url"],
                         headers=request_data["headers"],
-                        content=request_data["body"],
-                    ) as response,
-                ):
-                    logger.debug(
-                        "stream_response_received",
-                        status_code=response.status_code,
-                        headers=dict(response.headers),
                     )
 
-                    # Log initial stream response headers if verbose
-                    if self.verbose_logger.verbose_api:
-                        logger.info(
-                            "verbose_api_stream_response_start",
-                            status_code=response.status_code,
-                            headers=redact_sensitive_headers(dict(response.headers)),
+                async with stream_stack:
+                    if debug_enabled:
+                        logger.debug(
+                            "stream_response_received",
+                            status_code=response_status,
+                            headers=response_headers,
                         )
 
-                    # Store response status and headers
-                    response_status = response.status_code
-                    response_headers = dict(response.headers)
-
-                    # Log upstream response headers for streaming
+                    # Log initial stream response headers if verbose, and
+                    # write them to the request log
                     if self.verbose_logger.verbose_api:
-                        is_openai = self.response_transformer._is_openai_request(
-                            original_path
-                        )
+                        if is_info_enabled(__name__):
+                            logger.info(
+                                "verbose_api_stream_response_start",
+                                status_code=response_status,
+                                headers=redact_sensitive_headers(response_headers),
+                            )
                         await self.verbose_logger.log_stream_response_headers(
                             ctx=ctx,
-                            status_code=response.status_code,
-                            headers=dict(response.headers),
+                            status_code=response_status,
+                            headers=response_headers,
                             is_openai=is_openai,
                         )
 
                     # Transform streaming response based on format
-                    is_openai = self.response_transformer._is_openai_request(
-                        original_path
-                    )
-                    logger.debug(
-                        "openai_format_check", is_openai=is_openai, path=original_path
-                    )
+                    if debug_enabled:
+                        logger.debug(
+                            "openai_format_check",
+                            is_openai=is_openai,
+                            path=original_path,
+                        )
 
                     if is_openai:
                         async for chunk in self._stream_openai_format(
@@ -335,8 +484,10 @@ class StreamingHandler:
             ) as e:
                 # HTTP errors, timeouts, or async cancellation during streaming
                 logger.exception("streaming_error", error=str(e))
-                error_message = f'data: {{"error": "Streaming error: {e!s}"}}\n\n'
-                yield error_message.encode("utf-8")
+                # Serialize the frame so quotes or newlines in the message
+                # cannot break the JSON or the SSE framing
+                error_frame = orjson.dumps({"error": f"Streaming error: {e!s}"})
+                yield _SSE_DATA_PREFIX + error_frame + _SSE_EVENT_END
 
         return stream_generator()
 
@@ -357,26 +508,32 @@ class StreamingHandler:
             Transformed OpenAI format chunks
 
         """
-        logger.debug("sse_transform_start", path=original_path)
+        debug_enabled = is_debug_enabled(__name__)
+        if debug_enabled:
+            logger.debug("sse_transform_start", path=original_path)
 
         request_id = ctx.request_id
         timestamp = ctx.get_log_timestamp_prefix()
+        # Check the switch once per stream instead of awaiting a no-op per chunk
+        log_chunks = should_log_requests()
 
         async for transformed_chunk in self._transform_anthropic_to_openai_stream(
             response, original_path
         ):
             # Log transformed streaming chunk
-            await append_streaming_log(
-                request_id=request_id,
-                log_type="upstream_streaming",
-                data=transformed_chunk,
-                timestamp=timestamp,
-            )
+            if log_chunks:
+                await append_streaming_log(
+                    request_id=request_id,
+                    log_type="upstream_streaming",
+                    data=transformed_chunk,
+                    timestamp=timestamp,
+                )
 
-            logger.debug(
-                "transformed_chunk_yielded",
-                chunk_size=len(transformed_chunk),
-            )
+            if debug_enabled:
+                logger.debug(
+                    "transformed_chunk_yielded",
+                    chunk_size=len(transformed_chunk),
+                )
             yield transformed_chunk
 
     async def _stream_anthropic_format(
@@ -398,47 +555,64 @@ class StreamingHandler:
             Raw Anthropic format chunks
 
         """
-        logger.debug("anthropic_streaming_start")
+        debug_enabled = is_debug_enabled(__name__)
+        if debug_enabled:
+            logger.debug("anthropic_streaming_start")
         chunk_count = 0
         content_block_delta_count = 0
 
         verbose_streaming = self.verbose_logger.verbose_streaming
         request_id = ctx.request_id
         timestamp = ctx.get_log_timestamp_prefix()
+        # Check the switch once per stream instead of awaiting a no-op per chunk
+        log_chunks = should_log_requests()
+
+        process_chunk = metrics_collector.process_chunk
 
-        async for chunk in response.aiter_bytes():
+        # Pick the loop once per stream: with neither chunk logging nor debug
+        # events, chunks only feed the metrics collector
+        if not (log_chunks or debug_enabled):
+            async for chunk in _aiter_upstream_chunks(response):
+                if chunk:
+                    process_chunk(chunk)
+                    yield chunk
+            return
+
+        async for chunk in _aiter_upstream_chunks(response):
             if chunk:
                 chunk_count += 1
 
                 # Log raw streaming chunk
-                await append_streaming_log(
-                    request_id=request_id,
-                    log_type="upstream_streaming",
-                    data=chunk,
-                    timestamp=timestamp,
-                )
+                if log_chunks:
+                    await append_streaming_log(
+                        request_id=request_id,
+                        log_type="upstream_streaming",
+                        data=chunk,
+                        timestamp=timestamp,
+                    )
 
                 # Process chunk for metrics
-                chunk_str = chunk.decode("utf-8", errors="replace")
-                metrics_collector.process_chunk(chunk_str)
-
-                # Handle logging based on chunk type
-                if "content_block_delta" in chunk_str and not verbose_streaming:
-                    content_block_delta_count += 1
-                    if content_block_delta_count == 1:
-                        logger.debug("content_block_delta_start")
-                    elif content_block_delta_count % 10 == 0:
+                process_chunk(chunk)
+
+                # Handle logging based on chunk type; chunks are matched as
+                # bytes and only when debug events are emitted
+                if debug_enabled:
+                    if b"content_block_delta" in chunk and not verbose_streaming:
+                        content_block_delta_count += 1
+                        if content_block_delta_count == 1:
+                            logger.debug("content_block_delta_start")
+                        elif content_block_delta_count % 10 == 0:
+                            logger.debug(
+                                "content_block_delta_progress",
+                                count=content_block_delta_count,
+                            )
+                    else:
                         logger.debug(
-                            "content_block_delta_progress",
-                            count=content_block_delta_count,
+                            "chunk_yielded",
+                            chunk_number=chunk_count,
+                            chunk_size=len(chunk),
+                            chunk_preview=chunk[:100].decode("utf-8", errors="replace"),
                         )
-                elif verbose_streaming or "content_block_delta" not in chunk_str:
-                    logger.debug(
-                        "chunk_yielded",
-                        chunk_number=chunk_count,
-                        chunk_size=len(chunk),
-                        chunk_preview=chunk[:100].decode("utf-8", errors="replace"),
-                    )
 
                 yield chunk
 
@@ -454,7 +628,8 @@ class StreamingHandler:
     ) -> AsyncGenerator[bytes, None]:
         """Transform Anthropic SSE stream to OpenAI SSE format.
 
-        Uses httpx-sse EventSource for proper SSE parsing.
+        Events are split from the raw bytes and their data parsed by orjson
+        without decoding to str first.
 
         Args:
             response: Streaming response from Anthropic
@@ -464,29 +639,34 @@ class StreamingHandler:
             Transformed OpenAI SSE format chunks
 
         """
+        # Each event would otherwise be copied into a debug event dict
+        debug_enabled = is_debug_enabled(__name__)
 
         async def sse_to_dict_stream() -> AsyncGenerator[dict[str, object], None]:
             chunk_count = 0
-            event_source = EventSource(response)
-            async for sse in event_source.aiter_sse():
-                if sse.data and sse.data != "[DONE]":
+            async for data in _aiter_sse_data(_aiter_upstream_chunks(response)):
+                if data and data != b"[DONE]":
                     try:
-                        chunk_data = orjson.loads(sse.data)
+                        chunk_data = orjson.loads(data)
                         chunk_count += 1
-                        logger.debug(
-                            "proxy_anthropic_chunk_received",
-                            chunk_count=chunk_count,
-                            chunk_type=chunk_data.get("type"),
-                            chunk=chunk_data,
-                        )
+                        if debug_enabled:
+                            logger.debug(
+                                "proxy_anthropic_chunk_received",
+                                chunk_count=chunk_count,
+                                chunk_type=chunk_data.get("type"),
+                                chunk=chunk_data,
+                            )
                         yield chunk_data
                     except ValueError:
-                        logger.warning("sse_parse_failed", data=sse.data)
+                        logger.warning(
+                            "sse_parse_failed",
+                            data=data.decode("utf-8", errors="replace"),
+                        )
                         continue
 
         # Transform using OpenAI adapter and format back to SSE
         async for openai_chunk in self.openai_adapter.adapt_stream(
             sse_to_dict_stream()
         ):
-            sse_line = f"data: {orjson.dumps(openai_chunk).decode()}\n\n"
-            yield sse_line.encode("utf-8")
+            # Frame the serialized bytes directly, no str round trip
+            yield _SSE_DATA_PREFIX + orjson.dumps(openai_chunk) + _SSE_EVENT_END
@@ -9,6 +9,8 @@ from typing import TYPE_CHECKING
 import structlog
 from fastapi import HTTPException, Request
 
+from claude_code_proxy.rotation.middleware import get_rotation_token
+
 
 if TYPE_CHECKING:
     from claude_code_proxy.services.credentials.manager import CredentialsManager
@@ -36,6 +38,38 @@ class TokenProvider:
         """
         self.credentials_manager = credentials_manager
 
+    def get_request_token(self, request: Request | None = None) -> str | None:
+        """Get the rotation account token attached to the request, if any.
+
+        This never touches stored credentials, so it can be called before
+        deciding whether token retrieval needs to await anything.
+
+        Args:
+            request: Optional FastAPI request to check for rotation account
+
+        Returns:
+            Rotation access token, or None if the request has none
+
+        """
+        if request is None:
+            return None
+
+        # First check for pre-captured token (avoids race with refresh scheduler)
+        rotation_token: str | None = getattr(request.state, "rotation_token", None)
+        if not rotation_token:
+            # Fallback to helper function (for manual account selection)
+            rotation_token = get_rotation_token(request)
+        if not rotation_token:
+            return None
+
+        rotation_account = getattr(request.state, "rotation_account", None)
+        account_name = rotation_account.name if rotation_account else "unknown"
+        logger.debug(
+            "using_rotation_token",
+            account=account_name,
+        )
+        return rotation_token
+
     async def get_token(self, request: Request | None = None) -> str:
         """Get access token for upstream authentication.
 
@@ -55,30 +89,9 @@ class TokenProvider:
 
         """
         # Check for rotation account first (set by RotationMiddleware)
-        if request is not None:
-            # First check for pre-captured token (avoids race with refresh scheduler)
-            rotation_token: str | None = getattr(request.state, "rotation_token", None)
-            if rotation_token:
-                rotation_account = getattr(request.state, "rotation_account", None)
-                account_name = rotation_account.name if rotation_account else "unknown"
-                logger.debug(
-                    "using_rotation_token",
-                    account=account_name,
-                )
-                return rotation_token
-
-            # Fallback to helper function (for manual account selection)
-            from claude_code_proxy.rotation.middleware import get_rotation_token
-
-            rotation_token = get_rotation_token(request)
-            if rotation_token:
-                rotation_account = getattr(request.state, "rotation_account", None)
-                account_name = rotation_account.name if rotation_account else "unknown"
-                logger.debug(
-                    "using_rotation_token",
-                    account=account_name,
-                )
-                return rotation_token
+        rotation_token = self.get_request_token(request)
+        if rotation_token:
+            return rotation_token
 
         # Fall back to OAuth credentials from Claude CLI
         # The SECURITY__AUTH_TOKEN is only for client authentication, not upstream
@@ -4,12 +4,12 @@ This module provides structured logging for debugging and monitoring
 Claude API traffic.
 """
 
-import contextlib
 from typing import TYPE_CHECKING
 
 import orjson
 import structlog
 
+from claude_code_proxy.core.logging import is_info_enabled
 from claude_code_proxy.services.request_metadata import redact_sensitive_headers
 from claude_code_proxy.utils.simple_request_logger import (
     append_streaming_log,
@@ -18,11 +18,31 @@ from claude_code_proxy.utils.simple_request_logger import (
 
 
 if TYPE_CHECKING:
+    from claude_code_proxy.core.http_transformers import RequestData
     from claude_code_proxy.core.request_context import RequestContext
-    from claude_code_proxy.services.proxy_service import RequestData
 
 logger = structlog.get_logger(__name__)
 
+# Body previews in log events are truncated to this many characters
+_BODY_PREVIEW_CHARS = 1024
+
+
+def _body_preview(body: bytes) -> str:
+    """Decode the start of a body for a log event preview.
+
+    UTF-8 uses at most four bytes per character, so only that many leading
+    bytes are decoded regardless of the body size.
+
+    Args:
+        body: Request or response body bytes
+
+    Returns:
+        Up to _BODY_PREVIEW_CHARS characters of the decoded body
+
+    """
+    leading_bytes = body[: 4 * _BODY_PREVIEW_CHARS]
+    return leading_bytes.decode("utf-8", errors="replace")[:_BODY_PREVIEW_CHARS]
+
 
 class VerboseLogger:
     """Handles verbose logging for API requests and responses.
@@ -64,25 +84,29 @@ class VerboseLogger:
         full_body = None
         if body:
             try:
-                full_body = body.decode("utf-8", errors="replace")
                 # Truncate at 1024 chars for readability
-                body_preview = full_body[:1024]
-                # Try to parse as JSON for better formatting
-                with contextlib.suppress(orjson.JSONDecodeError):
-                    full_body = orjson.loads(full_body)
+                body_preview = _body_preview(body)
+                # Try to parse as JSON for better formatting; orjson reads the
+                # raw bytes, so JSON bodies are never decoded in full
+                try:
+                    full_body = orjson.loads(body)
+                except orjson.JSONDecodeError:
+                    full_body = body.decode("utf-8", errors="replace")
             except (UnicodeDecodeError, AttributeError):
                 # UnicodeDecodeError: Binary content that can't be decoded
                 # AttributeError: Body is None or not bytes
                 body_preview = f"<binary data of length {len(body)}>"
 
-        logger.info(
-            "verbose_api_request",
-            method=request_data["method"],
-            url=request_data["url"],
-            headers=redact_sensitive_headers(request_data["headers"]),
-            body_size=len(body) if body else 0,
-            body_preview=body_preview,
-        )
+        # Only redact the headers when the event is actually emitted
+        if is_info_enabled(__name__):
+            logger.info(
+                "verbose_api_request",
+                method=request_data["method"],
+                url=request_data["url"],
+                headers=redact_sensitive_headers(request_data["headers"]),
+                body_size=len(body) if body else 0,
+                body_preview=body_preview,
+            )
 
         # Use new request logging system
         request_id = ctx.request_id
@@ -93,7 +117,7 @@ class VerboseLogger:
             data={
                 "method": request_data["method"],
                 "url": request_data["url"],
-                "headers": dict(request_data["headers"]),  # Don't redact in file
+                "headers": request_data["headers"],  # Don't redact in file
                 "body": full_body,
             },
             timestamp=timestamp,
@@ -119,37 +143,32 @@ class VerboseLogger:
             return
 
         body_preview = ""
-        if body:
-            try:
-                # Truncate at 1024 chars for readability
-                body_preview = body.decode("utf-8", errors="replace")[:1024]
-            except (UnicodeDecodeError, AttributeError):
-                # UnicodeDecodeError: Binary content that can't be decoded
-                # AttributeError: Body is None or not bytes
-                body_preview = f"<binary data of length {len(body)}>"
-
-        logger.info(
-            "verbose_api_response",
-            status_code=status_code,
-            headers=redact_sensitive_headers(headers),
-            body_size=len(body),
-            body_preview=body_preview,
-        )
-
-        # Use new request logging system
         full_body = None
         if body:
             try:
-                full_body_str = body.decode("utf-8", errors="replace")
-                # Try to parse as JSON for better formatting
+                # Truncate at 1024 chars for readability
+                body_preview = _body_preview(body)
+                # Try to parse as JSON for better formatting; orjson reads the
+                # raw bytes, so JSON bodies are never decoded in full
                 try:
-                    full_body = orjson.loads(full_body_str)
+                    full_body = orjson.loads(body)
                 except orjson.JSONDecodeError:
-                    full_body = full_body_str
+                    full_body = body.decode("utf-8", errors="replace")
             except (UnicodeDecodeError, AttributeError):
                 # UnicodeDecodeError: Binary content that can't be decoded
                 # AttributeError: Body is None or not bytes
-                full_body = f"<binary data of length {len(body)}>"
+                body_preview = f"<binary data of length {len(body)}>"
+                full_body = body_preview
+
+        # Only redact the headers when the event is actually emitted
+        if is_info_enabled(__name__):
+            logger.info(
+                "verbose_api_response",
+                status_code=status_code,
+                headers=redact_sensitive_headers(headers),
+                body_size=len(body),
+                body_preview=body_preview,
+            )
 
         # Use new request logging system
         request_id = ctx.request_id
@@ -159,7 +178,7 @@ class VerboseLogger:
             log_type="upstream_response",
             data={
                 "status_code": status_code,
-                "headers": dict(headers),  # Don't redact in file
+                "headers": headers,  # Don't redact in file
                 "body": full_body,
             },
             timestamp=timestamp,
@@ -191,7 +210,7 @@ class VerboseLogger:
             log_type="upstream_response_headers",
             data={
                 "status_code": status_code,
-                "headers": dict(headers),
+                "headers": headers,
                 "stream_type": "openai_sse" if is_openai else "anthropic_sse",
             },
             timestamp=timestamp,
@@ -211,6 +230,9 @@ class VerboseLogger:
             timestamp: Optional timestamp (uses context timestamp if not provided)
 
         """
+        if not (self.verbose_streaming or self.verbose_api):
+            return
+
         request_id = ctx.request_id
         ts = timestamp or ctx.get_log_timestamp_prefix()
         await append_streaming_log(
@@ -1,8 +1,9 @@
 """Utility modules for shared functionality across the application."""
 
-from .id_generator import generate_client_id
+from .id_generator import generate_client_id, generate_request_id
 
 
 __all__ = [
     "generate_client_id",
+    "generate_request_id",
 ]
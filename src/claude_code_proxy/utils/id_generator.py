@@ -1,6 +1,18 @@
 """Utility functions for generating consistent IDs across the application."""
 
-import shortuuid
+import hashlib
+import itertools
+import secrets
+
+
+# Random per-process prefix plus a counter keeps request IDs unique without
+# drawing fresh entropy for every request
+_REQUEST_ID_PREFIX = secrets.token_hex(4)
+_request_id_counter = itertools.count(1)
+# Counter hasher keyed per process; request IDs are returned to clients, so
+# the raw counter would reveal how many requests were served. Copying the
+# keyed state is cheaper than re-keying for every ID
+_REQUEST_ID_HASH = hashlib.blake2b(digest_size=8, key=secrets.token_bytes(16))
 
 
 def generate_client_id() -> str:
@@ -10,4 +22,20 @@ def generate_client_id() -> str:
         str: Short URL-safe ID (22 characters)
 
     """
+    # Only SDK sessions need these IDs; keep shortuuid off the request path
+    import shortuuid
+
     return shortuuid.uuid()
+
+
+def generate_request_id() -> str:
+    """Generate a request ID that is unique within this process.
+
+    Returns:
+        str: Hex ID made of a per-process prefix and a keyed hash of a
+        monotonic counter
+
+    """
+    suffix = _REQUEST_ID_HASH.copy()
+    suffix.update(next(_request_id_counter).to_bytes(8, "little"))
+    return f"{_REQUEST_ID_PREFIX}{suffix.hexdigest()}"
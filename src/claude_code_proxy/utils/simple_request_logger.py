@@ -2,7 +2,8 @@
 
 import asyncio
 import os
-from datetime import UTC, datetime
+import time
+from collections.abc import Mapping
 from pathlib import Path
 from typing import Any
 
@@ -18,6 +19,12 @@ _STREAMING_BATCH_SIZE = 8192  # Batch chunks until we have 8KB
 _STREAMING_BATCH_TIMEOUT = 0.1  # Or flush after 100ms
 # TTLCache with 60s TTL to auto-cleanup abandoned streaming batches
 _streaming_batches: TTLCache[str, dict[str, Any]] = TTLCache(maxsize=10000, ttl=60)  # type: ignore[no-any-unimported]
+# Last second formatted by get_timestamp_prefix and its prefix; the prefix
+# has one-second resolution, so it is only reformatted when the second changes
+_timestamp_cache: tuple[int, str] = (0, "")
+# Log directories already created by this process; every log write resolves
+# the directory, so the mkdir syscall is only issued the first time
+_created_log_dirs: set[str] = set()
 
 
 def should_log_requests() -> bool:
@@ -42,9 +49,11 @@ def get_request_log_dir() -> Path | None:
         return None
 
     path = Path(log_dir)
+    if log_dir in _created_log_dirs:
+        return path
+
     try:
         path.mkdir(parents=True, exist_ok=True)
-        return path
     except OSError as e:
         # OSError: Directory creation errors (permissions, invalid path)
         logger.exception(
@@ -54,6 +63,48 @@ def get_request_log_dir() -> Path | None:
         )
         return None
 
+    _created_log_dirs.add(log_dir)
+    return path
+
+
+def _json_default(value: Any) -> Any:
+    """Convert values orjson cannot serialize natively.
+
+    Header mappings such as httpx.Headers are logged as objects; anything
+    else falls back to its string form.
+
+    Args:
+        value: Value orjson could not serialize
+
+    Returns:
+        A serializable replacement
+
+    """
+    if isinstance(value, Mapping):
+        return dict(value)
+    return str(value)
+
+
+def _write_log_file(file_path: Path, data: bytes, mode: str = "wb") -> None:
+    """Write data to a log file, recreating its directory if it was removed.
+
+    The log directory is only created once per process, so a directory
+    deleted afterwards (e.g. by log cleanup) is recreated here on demand.
+
+    Args:
+        file_path: Log file to write
+        data: Bytes to write
+        mode: File open mode, "wb" to replace or "ab" to append
+
+    """
+    try:
+        with file_path.open(mode) as f:
+            f.write(data)
+    except FileNotFoundError:
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        with file_path.open(mode) as f:
+            f.write(data)
+
 
 def get_timestamp_prefix() -> str:
     """Generate timestamp prefix in YYYYMMDDhhmmss format.
@@ -62,7 +113,13 @@ def get_timestamp_prefix() -> str:
         Timestamp string in YYYYMMDDhhmmss format (UTC)
 
     """
-    return datetime.now(UTC).strftime("%Y%m%d%H%M%S")
+    global _timestamp_cache
+    now = int(time.time())
+    cached_second, prefix = _timestamp_cache
+    if now != cached_second:
+        prefix = time.strftime("%Y%m%d%H%M%S", time.gmtime(now))
+        _timestamp_cache = (now, prefix)
+    return prefix
 
 
 async def write_request_log(
@@ -94,8 +151,16 @@ async def write_request_log(
     try:
         # Write JSON data to file asynchronously
         def write_file() -> None:
-            with file_path.open("wb") as f:
-                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2, default=str))
+            # orjson emits bytes, so the file is written without a str round
+            # trip; the trailing newline is added by the serializer itself
+            _write_log_file(
+                file_path,
+                orjson.dumps(
+                    data,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE,
+                    default=_json_default,
+                ),
+            )
 
         # Run in thread pool to avoid blocking
         await asyncio.get_event_loop().run_in_executor(None, write_file)
@@ -147,8 +212,7 @@ async def write_streaming_log(
     try:
         # Write raw data to file asynchronously
         def write_file() -> None:
-            with file_path.open("wb") as f:
-                f.write(data)
+            _write_log_file(file_path, data)
 
         # Run in thread pool to avoid blocking
         await asyncio.get_event_loop().run_in_executor(None, write_file)
@@ -194,15 +258,15 @@ async def append_streaming_log(
     if not log_dir:
         return
 
-    timestamp = timestamp or get_timestamp_prefix()
     batch_key = f"{request_id}_{log_type}"
 
-    # Get or create batch for this request/log_type combination
+    # Get or create batch for this request/log_type combination; the
+    # timestamp only names the file, so it is only formatted for a new batch
     if batch_key not in _streaming_batches:
         _streaming_batches[batch_key] = {
             "request_id": request_id,
             "log_type": log_type,
-            "timestamp": timestamp,
+            "timestamp": timestamp or get_timestamp_prefix(),
             "data": bytearray(),
             "chunk_count": 0,
             "first_chunk_time": asyncio.get_event_loop().time(),
@@ -213,10 +277,6 @@ async def append_streaming_log(
     batch["data"].extend(data)
     batch["chunk_count"] += 1
 
-    # Cancel previous flush task if it exists
-    if batch["last_flush_task"] and not batch["last_flush_task"].done():
-        batch["last_flush_task"].cancel()
-
     # Check if we should flush now
     should_flush = (
         len(batch["data"]) >= _STREAMING_BATCH_SIZE
@@ -224,9 +284,13 @@ async def append_streaming_log(
     )
 
     if should_flush:
+        # The batch is written now, so its pending delayed flush is not needed
+        if batch["last_flush_task"] and not batch["last_flush_task"].done():
+            batch["last_flush_task"].cancel()
         await _flush_streaming_batch(batch_key)
-    else:
-        # Schedule a delayed flush
+    elif batch["last_flush_task"] is None:
+        # Schedule one delayed flush per batch; later chunks are picked up by
+        # it rather than creating a new task for every chunk
         batch["last_flush_task"] = asyncio.create_task(
             _delayed_flush_streaming_batch(batch_key, _STREAMING_BATCH_TIMEOUT)
         )
@@ -263,8 +327,7 @@ async def _flush_streaming_batch(batch_key: str) -> None:
     try:
         # Append batched data to file asynchronously
         def append_file() -> None:
-            with file_path.open("ab") as f:
-                f.write(batch["data"])
+            _write_log_file(file_path, batch["data"], "ab")
 
         # Run in thread pool to avoid blocking
         await asyncio.get_event_loop().run_in_executor(None, append_file)
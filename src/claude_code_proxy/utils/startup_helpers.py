@@ -457,6 +457,39 @@ async def setup_permission_service_shutdown(app: FastAPI, settings: Settings) ->
             logger.exception("permission_service_stop_failed", error=str(e))
 
 
+async def initialize_http_client_startup(app: FastAPI, settings: Settings) -> None:
+    """Create the shared upstream HTTP client and store it in app state.
+
+    Args:
+        app: FastAPI application instance
+        settings: Application settings
+
+    """
+    from claude_code_proxy.core.http import create_http_client
+
+    app.state.http_client = create_http_client()
+    logger.debug("http_client_initialized")
+
+
+async def shutdown_http_client(app: FastAPI) -> None:
+    """Close the shared upstream HTTP client.
+
+    Args:
+        app: FastAPI application instance
+
+    """
+    http_client = getattr(app.state, "http_client", None)
+    if http_client is None:
+        return
+    try:
+        await http_client.close()
+        logger.debug("http_client_closed")
+    # Catch transport cleanup errors during shutdown
+    except (RuntimeError, OSError) as e:
+        logger.exception("http_client_close_failed", error=str(e))
+    app.state.http_client = None
+
+
 async def flush_streaming_batches_shutdown(app: FastAPI) -> None:
     """Flush any remaining streaming log batches.
 
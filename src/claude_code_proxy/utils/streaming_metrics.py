@@ -80,86 +80,90 @@ class StreamingMetricsCollector:
             cache_read_tokens=None,
             cache_write_tokens=None,
         )
+        # Trailing partial line carried over to the next chunk, so memory stays
+        # bounded by one SSE line rather than the whole stream; a bytearray is
+        # extended in place, so a long line split over many chunks is not
+        # re-copied on every call
+        self._tail = bytearray()
 
-    def process_chunk(self, chunk_str: str) -> bool:
+    def process_chunk(self, chunk: bytes) -> bool:
         """Process a streaming chunk to extract token metrics.
 
+        Chunks are split into SSE lines incrementally; a line cut across two
+        chunks is completed by the next call.
+
         Args:
-            chunk_str: Raw chunk string from streaming response
+            chunk: Raw chunk bytes from streaming response
 
         Returns:
-            True if this was the final chunk with complete metrics, False otherwise
+            True if this chunk completed the final event with metrics, False otherwise
 
         """
-        # Check if this chunk contains usage information
-        # Look for usage data in any chunk - the event type will be determined from the JSON
-        if "usage" not in chunk_str:
+        end = chunk.rfind(b"\n")
+        if end == -1:
+            self._tail += chunk
+            return False
+        if self._tail:
+            self._tail += chunk[:end]
+            data = bytes(self._tail)
+            self._tail.clear()
+        else:
+            data = chunk[:end]
+        self._tail += chunk[end + 1 :]
+
+        # Only lines carrying usage data are worth parsing
+        if b"usage" not in data:
             return False
 
-        logger.debug(
-            "Processing chunk with usage",
-            chunk_preview=chunk_str[:300],
-            request_id=self.request_id,
-        )
-
-        try:
-            # Parse SSE data lines to find usage information
-            for line in chunk_str.split("\n"):
-                if line.startswith("data: "):
-                    data_str = line[6:].strip()
-                    if data_str and data_str != "[DONE]":
-                        event_data = orjson.loads(data_str)
-                        usage_data = extract_usage_from_streaming_chunk(event_data)
-
-                        if usage_data:
-                            event_type = usage_data.get("event_type")
-
-                            # Handle message_start: get input tokens and initial cache tokens
-                            if event_type == "message_start":
-                                self.metrics["tokens_input"] = usage_data.get(
-                                    "input_tokens"
-                                )
-                                self.metrics["cache_read_tokens"] = (
-                                    usage_data.get("cache_read_input_tokens")
-                                    or self.metrics["cache_read_tokens"]
-                                )
-                                self.metrics["cache_write_tokens"] = (
-                                    usage_data.get("cache_creation_input_tokens")
-                                    or self.metrics["cache_write_tokens"]
-                                )
-                                logger.debug(
-                                    "Extracted input tokens from message_start",
-                                    tokens_input=self.metrics["tokens_input"],
-                                    cache_read_tokens=self.metrics["cache_read_tokens"],
-                                    cache_write_tokens=self.metrics[
-                                        "cache_write_tokens"
-                                    ],
-                                    request_id=self.request_id,
-                                )
-                                return False  # Not final yet
-
-                            # Handle message_delta: get final output tokens
-                            if event_type == "message_delta":
-                                self.metrics["tokens_output"] = usage_data.get(
-                                    "output_tokens"
-                                )
-                                logger.debug(
-                                    "Extracted output tokens from message_delta",
-                                    tokens_output=self.metrics["tokens_output"],
-                                    request_id=self.request_id,
-                                )
-                                return True  # This is the final event
-
-                        break  # Only process first valid data line
-
-        except (orjson.JSONDecodeError, KeyError) as e:
-            logger.debug(
-                "Failed to parse streaming token metrics",
-                error=str(e),
-                request_id=self.request_id,
-            )
-
-        return False
+        final = False
+        for line in data.split(b"\n"):
+            if not line.startswith(b"data: ") or b"usage" not in line:
+                continue
+            try:
+                event_data = orjson.loads(line[6:])
+            except orjson.JSONDecodeError as e:
+                logger.debug(
+                    "Failed to parse streaming token metrics",
+                    error=str(e),
+                    request_id=self.request_id,
+                )
+                continue
+
+            usage_data = extract_usage_from_streaming_chunk(event_data)
+            if not usage_data:
+                continue
+            event_type = usage_data.get("event_type")
+
+            # Handle message_start: get input tokens and initial cache tokens
+            if event_type == "message_start":
+                self.metrics["tokens_input"] = usage_data.get("input_tokens")
+                self.metrics["cache_read_tokens"] = (
+                    usage_data.get("cache_read_input_tokens")
+                    or self.metrics["cache_read_tokens"]
+                )
+                self.metrics["cache_write_tokens"] = (
+                    usage_data.get("cache_creation_input_tokens")
+                    or self.metrics["cache_write_tokens"]
+                )
+                logger.debug(
+                    "Extracted input tokens from message_start",
+                    tokens_input=self.metrics["tokens_input"],
+                    cache_read_tokens=self.metrics["cache_read_tokens"],
+                    cache_write_tokens=self.metrics["cache_write_tokens"],
+                    request_id=self.request_id,
+                )
+
+            # Handle message_delta: get final output tokens
+            elif event_type == "message_delta":
+                self.metrics["tokens_output"] = usage_data.get("output_tokens")
+                logger.debug(
+                    "Extracted output tokens from message_delta",
+                    tokens_output=self.metrics["tokens_output"],
+                    request_id=self.request_id,
+                )
+                final = True
+
+        return final
 
     def get_metrics(self) -> StreamingTokenMetrics:
         """Get the current collected metrics.
@@ -0,0 +1,39 @@
+"""Tests for the shared API dependencies."""
+
+from types import SimpleNamespace
+from typing import Any, cast
+from unittest.mock import MagicMock, patch
+
+from fastapi import Request
+
+from claude_code_proxy.api import dependencies
+from claude_code_proxy.api.dependencies import get_proxy_service
+from claude_code_proxy.config.settings import Settings
+from claude_code_proxy.core.http import create_http_client
+
+
+def make_request(state: Any) -> Request:
+    """Build the request attributes read by get_proxy_service."""
+    return cast(Request, SimpleNamespace(app=SimpleNamespace(state=state)))
+
+
+def test_fallback_http_client_created_once() -> None:
+    """Test that a missing app HTTP client is created once and then shared."""
+    state = SimpleNamespace()
+    settings = cast(
+        Settings,
+        SimpleNamespace(
+            reverse_proxy=SimpleNamespace(target_url="https://api.anthropic.com")
+        ),
+    )
+
+    with patch.object(
+        dependencies, "create_http_client", wraps=create_http_client
+    ) as mock_create:
+        first = get_proxy_service(make_request(state), settings, MagicMock())
+        second = get_proxy_service(make_request(state), settings, MagicMock())
+
+    mock_create.assert_called_once()
+    assert state.http_client is first.proxy_client.http_client
+    assert second.proxy_client.http_client is state.http_client
+    assert first.owns_proxy_client is False
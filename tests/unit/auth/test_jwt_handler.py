@@ -52,3 +52,21 @@ class TestJWTHandler:
 
         with pytest.raises(ValueError, match="Invalid token"):
             handler2.validate_token(token)
+
+    def test_validate_token_uses_cache(self) -> None:
+        """Test that repeated validation of a token skips jwt.decode."""
+        from unittest.mock import patch
+
+        handler = JWTHandler(secret_key="test-secret-key-32-chars-long!!")
+        token = handler.generate_token(
+            user_id="john", key_id="key-123", expires_days=90
+        )
+
+        first = handler.validate_token(token)
+        with patch("jwt.decode") as decode:
+            second = handler.validate_token(token)
+            decode.assert_not_called()
+
+        assert second == first
+        second["sub"] = "mutated"
+        assert handler.validate_token(token)["sub"] == "john"
@@ -0,0 +1,73 @@
+"""Unit tests for logging configuration helpers."""
+
+import logging
+from pathlib import Path
+
+import orjson
+import pytest
+import structlog
+
+from claude_code_proxy.core.logging import (
+    is_debug_enabled,
+    is_info_enabled,
+    orjson_dumps,
+)
+
+
+class TestOrjsonDumps:
+    """Test the orjson serializer used by the JSON renderers."""
+
+    def test_renders_event_as_json_str(self) -> None:
+        """Test that JSONRenderer output is a JSON string of the event."""
+        renderer = structlog.processors.JSONRenderer(serializer=orjson_dumps)
+
+        rendered = renderer(
+            None, "info", {"event": "request_done", "status": 200, "path": "/v1/é"}
+        )
+
+        assert isinstance(rendered, str)
+        assert orjson.loads(rendered) == {
+            "event": "request_done",
+            "status": 200,
+            "path": "/v1/é",
+        }
+
+    def test_falls_back_for_unserializable_values(self) -> None:
+        """Test that values orjson cannot encode use the renderer fallback."""
+        renderer = structlog.processors.JSONRenderer(serializer=orjson_dumps)
+
+        rendered = renderer(
+            None, "info", {"event": "x", "path": Path("/tmp"), "codes": {404: "nf"}}
+        )
+
+        assert orjson.loads(rendered) == {
+            "event": "x",
+            "path": repr(Path("/tmp")),
+            "codes": {"404": "nf"},
+        }
+
+
+class TestLevelChecks:
+    """Test the per-module level checks used to skip filtered log events."""
+
+    @pytest.mark.parametrize(
+        ("level", "debug", "info"),
+        [
+            (logging.DEBUG, True, True),
+            (logging.INFO, False, True),
+            (logging.WARNING, False, False),
+        ],
+    )
+    def test_follows_stdlib_logger_level(
+        self, level: int, debug: bool, info: bool
+    ) -> None:
+        """Test that the checks match the named stdlib logger's level."""
+        name = "claude_code_proxy.tests.level_check"
+        logger = logging.getLogger(name)
+        previous = logger.level
+        logger.setLevel(level)
+        try:
+            assert is_debug_enabled(name) is debug
+            assert is_info_enabled(name) is info
+        finally:
+            logger.setLevel(previous)
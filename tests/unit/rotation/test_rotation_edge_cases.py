@@ -6,6 +6,7 @@ during failover scenarios.
 
 import asyncio
 import json
+import os
 from pathlib import Path
 
 import pytest
@@ -127,6 +128,30 @@ async def test_file_reload_during_active_requests(
     assert account_after_reload.access_token == "sk-ant-oat01-updated"
 
 
+@pytest.mark.unit
+def test_has_file_changed_detects_size_change(temp_accounts_file: Path) -> None:
+    """Test that the lock-free change check tracks mtime and size.
+
+    Verifies:
+    - No change is reported right after load
+    - A rewrite with different content is detected even if mtime is preserved
+    - Deleting the file is reported as a change
+    """
+    pool = RotationPool(accounts_path=temp_accounts_file)
+    assert pool.has_file_changed() is False
+
+    st = temp_accounts_file.stat()
+    temp_accounts_file.write_text(temp_accounts_file.read_text() + "\n")
+    os.utime(temp_accounts_file, ns=(st.st_atime_ns, st.st_mtime_ns))
+    assert pool.has_file_changed() is True
+
+    assert pool.reload_if_changed() is True
+    assert pool.has_file_changed() is False
+
+    temp_accounts_file.unlink()
+    assert pool.has_file_changed() is True
+
+
 @pytest.mark.unit
 @pytest.mark.asyncio
 async def test_token_refresh_during_failover(temp_accounts_file: Path) -> None:
@@ -315,7 +340,7 @@ async def test_token_refresh_blocks_startup(tmp_path: Path) -> None:
     refresh_called = False
     states_during_refresh = []
 
-    async def mock_refresh(account_name: str) -> bool:
+    async def mock_refresh(account_name: str, **_: object) -> bool:
         nonlocal refresh_called, states_during_refresh
         refresh_called = True
 
@@ -353,6 +378,144 @@ async def test_token_refresh_blocks_startup(tmp_path: Path) -> None:
     await scheduler.stop()
 
 
+@pytest.fixture
+def expired_pools(tmp_path: Path) -> list[RotationPool]:
+    """Create two pools, each holding one account with an expired token."""
+    from datetime import UTC, datetime
+
+    expired = int(datetime.now(UTC).timestamp() * 1000) - 3600000
+    pools = []
+    for name in ("alpha", "beta"):
+        path = tmp_path / f"{name}.json"
+        path.write_text(
+            json.dumps(
+                {
+                    "version": 1,
+                    "accounts": {
+                        name: {
+                            "accessToken": "sk-ant-oat01-test",
+                            "refreshToken": "sk-ant-ort01-test",
+                            "expiresAt": expired,
+                        }
+                    },
+                }
+            )
+        )
+        pools.append(RotationPool(accounts_path=path))
+    return pools
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_refresh_scheduler_shared_across_pools(
+    expired_pools: list[RotationPool],
+) -> None:
+    """Test that one refresh scheduler serves multiple pools.
+
+    Verifies:
+    - init_refresh_scheduler returns the same instance for every pool
+    - Accounts from every registered pool are checked
+    - Unregistering a pool removes it from the check loop
+    """
+    from unittest.mock import patch
+
+    from claude_code_proxy.rotation import refresh
+
+    pools = expired_pools
+    with patch.object(refresh, "_scheduler", None):
+        first = refresh.init_refresh_scheduler(pools[0])
+        second = refresh.init_refresh_scheduler(pools[1])
+        assert first is second
+        assert first.pools == tuple(pools)
+
+        refreshed: list[tuple[str, RotationPool | None]] = []
+
+        async def mock_refresh(
+            account_name: str, pool: RotationPool | None = None
+        ) -> bool:
+            refreshed.append((account_name, pool))
+            return True
+
+        first._refresh_with_retry = mock_refresh  # type: ignore[method-assign]
+        await first._check_and_refresh_all()
+        assert refreshed == [("alpha", pools[0]), ("beta", pools[1])]
+
+        first.unregister(pools[0])
+        refreshed.clear()
+        await first._check_and_refresh_all()
+        assert refreshed == [("beta", pools[1])]
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_running_scheduler_refreshes_only_new_pool(
+    expired_pools: list[RotationPool],
+) -> None:
+    """Test that registering a pool on a running scheduler refreshes only it.
+
+    Verifies:
+    - The first start() runs the initial refresh for its pool
+    - A later start(pool=...) refreshes the new pool, not every pool
+    """
+    from claude_code_proxy.rotation.refresh import TokenRefreshScheduler
+
+    scheduler = TokenRefreshScheduler(expired_pools[0])
+    refreshed: list[str] = []
+
+    async def mock_refresh(account_name: str, pool: RotationPool | None = None) -> bool:
+        refreshed.append(account_name)
+        return True
+
+    scheduler._refresh_with_retry = mock_refresh  # type: ignore[method-assign]
+    await scheduler.start(pool=expired_pools[0])
+    try:
+        assert refreshed == ["alpha"]
+
+        refreshed.clear()
+        scheduler.register(expired_pools[1])
+        await scheduler.start(pool=expired_pools[1])
+        assert refreshed == ["beta"]
+    finally:
+        await scheduler.stop()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_refresh_scheduler_startup_failure_unregisters_pool(
+    expired_pools: list[RotationPool],
+) -> None:
+    """Test that a failed scheduler start does not leave the pool registered.
+
+    Verifies:
+    - get_refresh_scheduler raises before any pool is registered
+    - A start() failure unregisters the pool from the shared scheduler
+    """
+    from types import SimpleNamespace
+    from unittest.mock import AsyncMock, MagicMock, patch
+
+    from claude_code_proxy.rotation import refresh
+    from claude_code_proxy.rotation.startup import (
+        initialize_refresh_scheduler_startup,
+    )
+
+    app = MagicMock()
+    app.state = SimpleNamespace(rotation_enabled=True, rotation_pool=expired_pools[0])
+
+    with patch.object(refresh, "_scheduler", None):
+        with pytest.raises(RuntimeError):
+            refresh.get_refresh_scheduler()
+
+        with patch.object(
+            refresh.TokenRefreshScheduler,
+            "start",
+            AsyncMock(side_effect=RuntimeError("no event loop")),
+        ):
+            await initialize_refresh_scheduler_startup(app, MagicMock())
+
+        assert app.state.refresh_scheduler is None
+        assert refresh.get_refresh_scheduler().pools == ()
+
+
 @pytest.mark.unit
 @pytest.mark.asyncio
 async def test_refreshing_state_prevents_selection(temp_accounts_file: Path) -> None:
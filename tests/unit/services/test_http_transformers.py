@@ -146,6 +146,19 @@ class TestHTTPRequestTransformer:
         assert result["Accept"] == "application/json"
         assert result["Connection"] == "keep-alive"
 
+    def test_create_proxy_headers_keeps_client_defaults_any_case(
+        self, request_transformer: HTTPRequestTransformer
+    ) -> None:
+        """Test that client headers in any case suppress the defaults."""
+        original_headers = {"content-type": "text/plain", "ACCEPT": "text/event-stream"}
+
+        result = request_transformer.create_proxy_headers(original_headers, "token")
+
+        assert result["content-type"] == "text/plain"
+        assert result["ACCEPT"] == "text/event-stream"
+        assert "Content-Type" not in result
+        assert "Accept" not in result
+
     def test_create_proxy_headers_without_access_token(
         self, request_transformer: HTTPRequestTransformer
     ) -> None:
@@ -341,6 +354,36 @@ class TestHTTPRequestTransformer:
         # Should return original body unchanged
         assert result == body
 
+    def test_transform_system_prompt_uses_given_data(
+        self, request_transformer: HTTPRequestTransformer
+    ) -> None:
+        """Test that parsed data passed in is used instead of the body."""
+        data: dict[str, Any] = {"messages": [{"role": "user", "content": "Hi"}]}
+
+        with patch(
+            "claude_code_proxy.core.http_transformers.orjson.loads"
+        ) as mock_loads:
+            result = request_transformer.transform_system_prompt(
+                b"not parsed", data=data
+            )
+
+        mock_loads.assert_not_called()
+        assert json.loads(result)["messages"] == data["messages"]
+        # The given dict is updated in place
+        assert "system" in data
+
+    def test_invalid_json_on_openai_path_is_forwarded_unchanged(
+        self, request_transformer: HTTPRequestTransformer
+    ) -> None:
+        """Test that an unparsable OpenAI body is left as is."""
+        body = b"invalid json content"
+
+        result = request_transformer.transform_request_body(
+            body, "/v1/chat/completions"
+        )
+
+        assert result == body
+
     def test_transform_system_prompt_minimal_mode(
         self, request_transformer: HTTPRequestTransformer
     ) -> None:
@@ -517,7 +560,7 @@ class TestHTTPRequestTransformer:
         result = request_transformer._is_openai_request(path, body)
         assert result is False
 
-    @patch("claude_code_proxy.adapters.openai.adapter.OpenAIAdapter")
+    @patch("claude_code_proxy.core.http_transformers.OpenAIAdapter")
     def test_transform_openai_to_anthropic_success(
         self, mock_adapter_class: Any, request_transformer: HTTPRequestTransformer
     ) -> None:
@@ -542,7 +585,7 @@ class TestHTTPRequestTransformer:
         assert result_data["model"] == "claude-3-5-sonnet-20241022"
         assert "max_tokens" in result_data
 
-    @patch("claude_code_proxy.adapters.openai.adapter.OpenAIAdapter")
+    @patch("claude_code_proxy.core.http_transformers.OpenAIAdapter")
     def test_transform_openai_to_anthropic_failure(
         self, mock_adapter_class: Any, request_transformer: HTTPRequestTransformer
     ) -> None:
@@ -564,26 +607,28 @@ class TestHTTPRequestTransformer:
     ) -> None:
         """Test request body transformation with OpenAI detection."""
         path = "/v1/chat/completions"
-        openai_body = json.dumps(
-            {"model": "gpt-4", "messages": [{"role": "user", "content": "Hello"}]}
-        ).encode("utf-8")
+        openai_data = {
+            "model": "gpt-4",
+            "messages": [{"role": "user", "content": "Hello"}],
+        }
+        openai_body = json.dumps(openai_data).encode("utf-8")
 
         with (
             patch.object(request_transformer, "_is_openai_request", return_value=True),
             patch.object(
-                request_transformer, "_transform_openai_to_anthropic"
+                request_transformer, "_adapt_openai_request"
             ) as mock_transform,
             patch.object(request_transformer, "transform_system_prompt") as mock_system,
         ):
-            mock_transform.return_value = b'{"transformed": true}'
+            mock_transform.return_value = {"transformed": True}
             mock_system.return_value = b'{"final": true}'
 
             result = request_transformer.transform_request_body(openai_body, path)
 
-            # Should detect OpenAI and transform
-            mock_transform.assert_called_once_with(openai_body)
+            # Should detect OpenAI and hand the converted data to the next step
+            mock_transform.assert_called_once_with(openai_data)
             mock_system.assert_called_once_with(
-                b'{"transformed": true}', None, "minimal"
+                openai_body, None, "minimal", {"transformed": True}
             )
             assert result == b'{"final": true}'
 
@@ -592,13 +637,12 @@ class TestHTTPRequestTransformer:
     ) -> None:
         """Test request body transformation for Anthropic requests."""
         path = "/v1/messages"
-        anthropic_body = json.dumps(
-            {
-                "model": "claude-3-5-sonnet-20241022",
-                "max_tokens": 100,
-                "messages": [{"role": "user", "content": "Hello"}],
-            }
-        ).encode("utf-8")
+        anthropic_data = {
+            "model": "claude-3-5-sonnet-20241022",
+            "max_tokens": 100,
+            "messages": [{"role": "user", "content": "Hello"}],
+        }
+        anthropic_body = json.dumps(anthropic_data).encode("utf-8")
 
         with (
             patch.object(request_transformer, "_is_openai_request", return_value=False),
@@ -609,9 +653,87 @@ class TestHTTPRequestTransformer:
             result = request_transformer.transform_request_body(anthropic_body, path)
 
             # Should only apply system prompt transformation
-            mock_system.assert_called_once_with(anthropic_body, None, "minimal")
+            mock_system.assert_called_once_with(
+                anthropic_body, None, "minimal", anthropic_data
+            )
             assert result == b'{"system_transformed": true}'
 
+    def test_transform_request_body_parses_unchanged_body_once(
+        self, request_transformer: HTTPRequestTransformer
+    ) -> None:
+        """Test that detection and system prompt injection share one parse."""
+        path = "/v1/messages"
+        anthropic_body = json.dumps(
+            {
+                "model": "claude-3-5-sonnet-20241022",
+                "messages": [{"role": "user", "content": "Hello"}],
+            }
+        ).encode("utf-8")
+
+        with patch(
+            "claude_code_proxy.core.http_transformers.orjson.loads",
+            wraps=json.loads,
+        ) as mock_loads:
+            result = request_transformer.transform_request_body(anthropic_body, path)
+
+        mock_loads.assert_called_once_with(anthropic_body)
+        result_data = json.loads(result)
+        assert result_data["system"][0]["type"] == "text"
+        assert result_data["messages"] == [{"role": "user", "content": "Hello"}]
+
+    def test_transform_request_body_parses_openai_body_once(
+        self, request_transformer: HTTPRequestTransformer
+    ) -> None:
+        """Test that the converted OpenAI body is not parsed again."""
+        path = "/v1/chat/completions"
+        openai_body = json.dumps(
+            {
+                "model": "gpt-4",
+                "messages": [{"role": "user", "content": "Hello"}],
+                "max_tokens": 16,
+            }
+        ).encode("utf-8")
+
+        with patch(
+            "claude_code_proxy.core.http_transformers.orjson.loads",
+            wraps=json.loads,
+        ) as mock_loads:
+            result = request_transformer.transform_request_body(openai_body, path)
+
+        mock_loads.assert_called_once_with(openai_body)
+        result_data = json.loads(result)
+        assert result_data["system"][0]["type"] == "text"
+        assert result_data["messages"][0]["role"] == "user"
+
+    async def test_transform_proxy_request_reuses_parsed_body(
+        self, request_transformer: HTTPRequestTransformer
+    ) -> None:
+        """Test that a body parsed by the caller is not parsed again."""
+        body_data = {
+            "model": "claude-3-5-sonnet-20241022",
+            "stream": True,
+            "messages": [{"role": "user", "content": "Hello"}],
+        }
+        body = json.dumps(body_data).encode("utf-8")
+
+        with patch(
+            "claude_code_proxy.core.http_transformers.orjson.loads",
+            wraps=json.loads,
+        ) as mock_loads:
+            result = await request_transformer.transform_proxy_request(
+                "POST",
+                "/v1/messages",
+                {},
+                body,
+                None,
+                "token",
+                parsed_body=body_data,
+            )
+
+        mock_loads.assert_not_called()
+        assert result["body"] is not None
+        assert "system" in json.loads(result["body"])
+
     def test_transform_request_body_empty_body(
         self, request_transformer: HTTPRequestTransformer
     ) -> None:
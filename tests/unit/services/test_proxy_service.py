@@ -0,0 +1,294 @@
+"""Tests for the proxy service request flow.
+
+Covers the non-streaming path of ProxyService.handle_request against an
+httpx.MockTransport upstream, so no network or credentials are used.
+"""
+
+import logging
+from collections.abc import Callable, Iterator, MutableMapping
+from types import SimpleNamespace
+from typing import Any, cast
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import orjson
+import pytest
+import structlog
+from fastapi import Request
+from structlog.testing import LogCapture
+
+from claude_code_proxy.config.claude import SystemPromptInjectionMode
+from claude_code_proxy.config.settings import Settings
+from claude_code_proxy.core.http import BaseProxyClient, HTTPXClient
+from claude_code_proxy.services import proxy_service as proxy_service_module
+from claude_code_proxy.services.proxy_service import ProxyService
+
+
+REQUEST_BODY = (
+    b'{"model":"claude-3-5-sonnet","messages":[{"role":"user","content":"Hi"}]}'
+)
+
+
+@pytest.fixture
+def settings() -> Settings:
+    """Provide the settings read by ProxyService."""
+    return cast(
+        Settings,
+        SimpleNamespace(
+            claude=SimpleNamespace(
+                system_prompt_injection_mode=SystemPromptInjectionMode.MINIMAL
+            )
+        ),
+    )
+
+
+@pytest.fixture
+def log_events() -> Iterator[list[MutableMapping[str, Any]]]:
+    """Capture structlog events, whatever configuration other tests left."""
+    config = structlog.get_config()
+    capture = LogCapture()
+    structlog.configure(
+        processors=[capture],
+        wrapper_class=structlog.BoundLogger,
+        cache_logger_on_first_use=False,
+    )
+    try:
+        yield capture.entries
+    finally:
+        structlog.configure(**config)
+
+
+def make_service(
+    settings: Settings,
+    handler: Callable[[httpx.Request], httpx.Response],
+    owns_proxy_client: bool = True,
+) -> ProxyService:
+    """Create a ProxyService whose upstream is served by ``handler``."""
+    http_client = HTTPXClient()
+    http_client._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    credentials_manager = MagicMock()
+    credentials_manager.get_access_token = AsyncMock(return_value="oauth-token")
+    return ProxyService(
+        proxy_client=BaseProxyClient(http_client),
+        credentials_manager=credentials_manager,
+        settings=settings,
+        owns_proxy_client=owns_proxy_client,
+    )
+
+
+def json_response(status_code: int, payload: dict[str, Any]) -> httpx.Response:
+    """Build an upstream JSON response."""
+    return httpx.Response(
+        status_code,
+        headers={"content-type": "application/json"},
+        content=orjson.dumps(payload),
+    )
+
+
+async def test_non_streaming_request_returns_upstream_body(
+    settings: Settings,
+) -> None:
+    """Test that a JSON response is forwarded with recomputed framing."""
+    payload = {"id": "msg_1", "usage": {"input_tokens": 3, "output_tokens": 5}}
+    requests: list[httpx.Request] = []
+
+    def upstream(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return json_response(200, payload)
+
+    service = make_service(settings, upstream)
+
+    result = await service.handle_request(
+        "POST", "/v1/messages", {"content-type": "application/json"}, REQUEST_BODY
+    )
+
+    assert isinstance(result, tuple)
+    status_code, headers, body = result
+    assert status_code == 200
+    assert orjson.loads(body) == payload
+    assert headers["Content-Length"] == str(len(body))
+    assert requests[0].headers["authorization"] == "Bearer oauth-token"
+
+
+@pytest.mark.parametrize(
+    ("status_code", "content_type", "content"),
+    [
+        (200, "text/plain", b"plain text"),
+        (200, "application/json", b"[]"),
+        (529, "application/json", b'{"type":"error"}'),
+    ],
+)
+async def test_usage_parse_skipped_for_non_usage_bodies(
+    settings: Settings,
+    caplog: pytest.LogCaptureFixture,
+    status_code: int,
+    content_type: str,
+    content: bytes,
+) -> None:
+    """Test that non-JSON, non-object and error bodies are never parsed."""
+    caplog.set_level(logging.DEBUG, logger=proxy_service_module.__name__)
+
+    def upstream(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            status_code, headers={"content-type": content_type}, content=content
+        )
+
+    service = make_service(settings, upstream)
+
+    with patch("orjson.loads", wraps=orjson.loads) as mock_loads:
+        result = await service.handle_request(
+            "POST", "/v1/messages", {"content-type": "application/json"}, REQUEST_BODY
+        )
+
+    assert isinstance(result, tuple)
+    assert result[0] == status_code
+    assert result[2] == content
+    assert all(call.args[0] != content for call in mock_loads.call_args_list)
+
+
+async def test_verbose_logging_skipped_when_disabled(settings: Settings) -> None:
+    """Test that the verbose API log hooks are not entered when disabled."""
+    service = make_service(settings, lambda request: json_response(200, {}))
+    service.verbose_logger.verbose_api = False
+
+    with (
+        patch.object(service.verbose_logger, "log_api_request") as mock_request,
+        patch.object(service.verbose_logger, "log_api_response") as mock_response,
+    ):
+        await service.handle_request(
+            "POST", "/v1/messages", {"content-type": "application/json"}, REQUEST_BODY
+        )
+
+    mock_request.assert_not_called()
+    mock_response.assert_not_called()
+
+
+async def test_rotation_token_skips_credentials_lookup(settings: Settings) -> None:
+    """Test that a token captured by the rotation middleware is used directly."""
+    requests: list[httpx.Request] = []
+
+    def upstream(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return json_response(200, {})
+
+    service = make_service(settings, upstream)
+    request = SimpleNamespace(
+        state=SimpleNamespace(
+            rotation_token="rotation-token", rotation_account=None, context=None
+        )
+    )
+
+    await service.handle_request(
+        "POST",
+        "/v1/messages",
+        {"content-type": "application/json"},
+        REQUEST_BODY,
+        request=cast(Request, request),
+    )
+
+    assert requests[0].headers["authorization"] == "Bearer rotation-token"
+    service.credentials_manager.get_access_token.assert_not_called()  # type: ignore[attr-defined]
+
+
+async def test_usage_parse_skipped_without_debug_logging(
+    settings: Settings, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test that the usage body is only parsed when debug logging is on."""
+    content = orjson.dumps({"usage": {"input_tokens": 3, "output_tokens": 5}})
+
+    def upstream(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200, headers={"content-type": "application/json"}, content=content
+        )
+
+    service = make_service(settings, upstream)
+    caplog.set_level(logging.INFO, logger=proxy_service_module.__name__)
+
+    with patch("orjson.loads", wraps=orjson.loads) as mock_loads:
+        await service.handle_request(
+            "POST", "/v1/messages", {"content-type": "application/json"}, REQUEST_BODY
+        )
+
+    assert all(call.args[0] != content for call in mock_loads.call_args_list)
+
+    caplog.set_level(logging.DEBUG, logger=proxy_service_module.__name__)
+
+    with patch("orjson.loads", wraps=orjson.loads) as mock_loads:
+        await service.handle_request(
+            "POST", "/v1/messages", {"content-type": "application/json"}, REQUEST_BODY
+        )
+
+    assert any(call.args[0] == content for call in mock_loads.call_args_list)
+
+
+async def test_get_request_skips_body_metadata(settings: Settings) -> None:
+    """Test that bodiless methods do not parse request metadata."""
+    requests: list[httpx.Request] = []
+
+    def upstream(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        return json_response(200, {"data": []})
+
+    service = make_service(settings, upstream)
+
+    with patch(
+        "claude_code_proxy.services.proxy_service.parse_request_body"
+    ) as mock_parse:
+        result = await service.handle_request("GET", "/v1/models", {})
+
+    mock_parse.assert_not_called()
+    assert isinstance(result, tuple)
+    assert result[0] == 200
+    assert requests[0].method == "GET"
+
+
+async def test_request_events_carry_request_fields(
+    settings: Settings,
+    caplog: pytest.LogCaptureFixture,
+    log_events: list[MutableMapping[str, Any]],
+) -> None:
+    """Test that request events carry the request id, method and path."""
+    service = make_service(settings, lambda request: json_response(200, {}))
+    caplog.set_level(logging.DEBUG, logger=proxy_service_module.__name__)
+
+    # A fresh logger proxy picks up the capture configuration; the module
+    # logger may already be cached with the configuration of other tests
+    with patch.object(
+        proxy_service_module,
+        "logger",
+        structlog.get_logger(proxy_service_module.__name__),
+    ):
+        await service.handle_request(
+            "POST", "/v1/messages", {"content-type": "application/json"}, REQUEST_BODY
+        )
+
+    by_name = {event["event"]: event for event in log_events}
+    request_events = [
+        by_name["request_transform_start"],
+        by_name["request_forwarding_start"],
+        by_name["non_streaming_response_detected"],
+    ]
+    request_ids = {event["request_id"] for event in request_events}
+    assert len(request_ids) == 1
+    assert all(request_ids)
+    for event in request_events:
+        assert event["method"] == "POST"
+        assert event["path"] == "/v1/messages"
+
+
+@pytest.mark.parametrize("owns_proxy_client", [True, False])
+async def test_close_only_closes_owned_client(
+    settings: Settings, owns_proxy_client: bool
+) -> None:
+    """Test that close() leaves a borrowed (shared) HTTP client open."""
+    service = make_service(
+        settings,
+        lambda request: json_response(200, {}),
+        owns_proxy_client=owns_proxy_client,
+    )
+    service.credentials_manager.__aexit__ = AsyncMock()
+    http_client = cast(HTTPXClient, service.proxy_client.http_client)
+
+    await service.close()
+
+    assert (http_client._client is None) is owns_proxy_client
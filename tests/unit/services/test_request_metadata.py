@@ -0,0 +1,101 @@
+"""Tests for request metadata helpers."""
+
+import pytest
+
+from claude_code_proxy.services.request_metadata import (
+    extract_message_type,
+    extract_metadata,
+    is_streaming_request,
+    parse_request_body,
+    redact_sensitive_headers,
+)
+
+
+@pytest.mark.unit
+class TestParseRequestBody:
+    """Test single-pass request body parsing."""
+
+    def test_parses_json_object(self) -> None:
+        """Test that a JSON object body is parsed into a dict."""
+        assert parse_request_body(b'{"model":"claude","stream":true}') == {
+            "model": "claude",
+            "stream": True,
+        }
+
+    @pytest.mark.parametrize("body", [None, b"", b"not json", b"[1, 2]", b"\xff"])
+    def test_rejects_non_object_bodies(self, body: bytes | None) -> None:
+        """Test that empty, invalid and non-object bodies yield None."""
+        assert parse_request_body(body) is None
+
+
+@pytest.mark.unit
+class TestExtractMetadata:
+    """Test metadata extraction from raw and pre-parsed bodies."""
+
+    def test_bytes_and_parsed_body_agree(self) -> None:
+        """Test that raw bytes and the parsed dict give the same metadata."""
+        body = b'{"model":"claude-3","stream":true}'
+
+        assert extract_metadata(body) == ("claude-3", True)
+        assert extract_metadata(parse_request_body(body)) == ("claude-3", True)
+
+    def test_invalid_body_defaults(self) -> None:
+        """Test defaults for a body that is not JSON."""
+        assert extract_metadata(b"not json") == (None, False)
+
+    def test_message_type_from_parsed_body(self) -> None:
+        """Test message type classification on a pre-parsed body."""
+        assert extract_message_type({"tools": [{"name": "t"}]}) == "tool_use"
+        assert (
+            extract_message_type({"messages": [{"role": "user", "content": "x" * 300}]})
+            == "long"
+        )
+        assert extract_message_type(b"not json") == "short"
+
+
+@pytest.mark.unit
+class TestIsStreamingRequest:
+    """Test streaming detection from request headers."""
+
+    @pytest.mark.parametrize(
+        "accept", ["text/event-stream", "Text/Event-Stream", "application/stream+json"]
+    )
+    def test_streaming_accept(self, accept: str) -> None:
+        """Test that stream accept types are detected in any case."""
+        assert is_streaming_request({"accept": accept}) is True
+
+    @pytest.mark.parametrize("headers", [{}, {"accept": ""}, {"accept": "*/*"}])
+    def test_non_streaming_accept(self, headers: dict[str, str]) -> None:
+        """Test that missing or non-stream accept headers are not streamed."""
+        assert is_streaming_request(headers) is False
+
+
+@pytest.mark.unit
+class TestRedactSensitiveHeaders:
+    """Test header redaction for logging."""
+
+    def test_redacts_sensitive_headers_in_any_case(self) -> None:
+        """Test that sensitive headers are redacted regardless of case."""
+        headers = {
+            "Authorization": "Bearer secret",
+            "x-api-key": "key",
+            "Cookie": "a=b",
+            "content-type": "application/json",
+            "x-cookie-hint": "kept",
+        }
+
+        assert redact_sensitive_headers(headers) == {
+            "Authorization": "[REDACTED]",
+            "x-api-key": "[REDACTED]",
+            "Cookie": "[REDACTED]",
+            "content-type": "application/json",
+            "x-cookie-hint": "kept",
+        }
+
+    def test_does_not_modify_input(self) -> None:
+        """Test that the original headers are left untouched."""
+        headers = {"authorization": "Bearer secret"}
+
+        redact_sensitive_headers(headers)
+
+        assert headers == {"authorization": "Bearer secret"}
@@ -0,0 +1,488 @@
+"""Tests for the streaming proxy handler.
+
+Covers the upstream request lifecycle of StreamingHandler: a single upstream
+request per proxied stream, pass-through of Anthropic SSE, conversion to
+OpenAI SSE, and error responses returned before streaming starts.
+
+Upstream traffic is served by an httpx.MockTransport, so no network is used.
+"""
+
+import asyncio
+import gzip
+import inspect
+import logging
+from collections.abc import AsyncIterator
+from typing import Any
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import orjson
+import pytest
+from fastapi.responses import StreamingResponse
+
+from claude_code_proxy.adapters.openai import OpenAIAdapter
+from claude_code_proxy.core.http import HTTPXClient
+from claude_code_proxy.core.http_transformers import (
+    HTTPResponseTransformer,
+    RequestData,
+)
+from claude_code_proxy.core.request_context import RequestContext
+from claude_code_proxy.services import streaming_handler as streaming_handler_module
+from claude_code_proxy.services.streaming_handler import (
+    StreamingHandler,
+    _aiter_sse_data,
+)
+from claude_code_proxy.services.verbose_logger import VerboseLogger
+
+
+ANTHROPIC_SSE = (
+    b"event: message_start\n"
+    b'data: {"type":"message_start","message":{"id":"msg_1","model":"claude",'
+    b'"usage":{"input_tokens":3}}}\n\n'
+    b"event: content_block_start\n"
+    b'data: {"type":"content_block_start","index":0,'
+    b'"content_block":{"type":"text","text":""}}\n\n'
+    b"event: content_block_delta\n"
+    b'data: {"type":"content_block_delta","index":0,'
+    b'"delta":{"type":"text_delta","text":"Hello"}}\n\n'
+    b"event: message_stop\n"
+    b'data: {"type":"message_stop"}\n\n'
+)
+
+
+class UpstreamRecorder:
+    """Mock upstream that records requests and replays a fixed response."""
+
+    def __init__(self, status_code: int = 200, content: bytes = ANTHROPIC_SSE):
+        self.status_code = status_code
+        self.content = content
+        self.requests: list[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        content_type = (
+            "text/event-stream" if self.status_code < 400 else "application/json"
+        )
+        # Serve the body as a stream, like a real transport would
+        return httpx.Response(
+            self.status_code,
+            headers={"content-type": content_type},
+            stream=httpx.ByteStream(self.content),
+        )
+
+
+def make_handler(upstream: UpstreamRecorder) -> StreamingHandler:
+    """Create a StreamingHandler backed by the mock upstream."""
+    http_client = HTTPXClient()
+    http_client._client = httpx.AsyncClient(transport=httpx.MockTransport(upstream))
+    return StreamingHandler(
+        response_transformer=HTTPResponseTransformer(),
+        openai_adapter=OpenAIAdapter(),
+        verbose_logger=VerboseLogger(verbose_api=False, verbose_streaming=False),
+        http_client=http_client,
+        proxy_mode="full",
+    )
+
+
+def make_request_data() -> RequestData:
+    """Create transformed request data for a streaming messages call."""
+    return {
+        "method": "POST",
+        "url": "https://api.anthropic.com/v1/messages",
+        "headers": {"content-type": "application/json"},
+        "body": b'{"model":"claude","stream":true}',
+    }
+
+
+async def collect(response: Any) -> bytes:
+    """Drain a StreamingResponse body iterator."""
+    assert isinstance(response, StreamingResponse)
+    return b"".join([chunk async for chunk in response.body_iterator])  # type: ignore[misc]
+
+
+@pytest.fixture
+def ctx() -> RequestContext:
+    """Create a request context."""
+    return RequestContext(request_id="req-test", method="POST", path="/v1/messages")
+
+
+async def test_anthropic_stream_makes_single_upstream_request(
+    ctx: RequestContext,
+) -> None:
+    """Test that Anthropic SSE is passed through with one upstream request."""
+    upstream = UpstreamRecorder()
+    handler = make_handler(upstream)
+
+    response = await handler.handle(make_request_data(), "/v1/messages", 30.0, ctx)
+    body = await collect(response)
+
+    assert len(upstream.requests) == 1
+    assert isinstance(response, StreamingResponse)
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "text/event-stream"
+    assert body == ANTHROPIC_SSE
+
+
+async def test_anthropic_stream_passthrough_with_debug_logging(
+    ctx: RequestContext, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test that per-chunk debug logging leaves the forwarded bytes untouched."""
+    caplog.set_level(logging.DEBUG, logger=streaming_handler_module.__name__)
+    handler = make_handler(UpstreamRecorder())
+
+    response = await handler.handle(make_request_data(), "/v1/messages", 30.0, ctx)
+
+    assert await collect(response) == ANTHROPIC_SSE
+
+
+async def test_openai_stream_with_debug_logging(
+    ctx: RequestContext, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test that the guarded per-event debug logging still converts the stream."""
+    caplog.set_level(logging.DEBUG, logger=streaming_handler_module.__name__)
+    handler = make_handler(UpstreamRecorder())
+
+    response = await handler.handle(
+        make_request_data(), "/v1/chat/completions", 30.0, ctx
+    )
+    body = await collect(response)
+
+    assert b'"content":"Hello"' in body
+
+
+async def test_quiet_anthropic_stream_still_collects_metrics(
+    ctx: RequestContext, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test that the stream loop without logging still feeds token metrics."""
+    monkeypatch.delenv("CCPROXY_LOG_REQUESTS", raising=False)
+    handler = make_handler(UpstreamRecorder())
+
+    with patch(
+        "claude_code_proxy.services.streaming_handler.StreamingMetricsCollector"
+    ) as mock_collector:
+        response = await handler.handle(make_request_data(), "/v1/messages", 30.0, ctx)
+        body = await collect(response)
+
+    assert body == ANTHROPIC_SSE
+    chunks = mock_collector.return_value.process_chunk.call_args_list
+    assert b"".join(call.args[0] for call in chunks) == ANTHROPIC_SSE
+
+
+@pytest.mark.parametrize("path", ["/v1/messages", "/v1/chat/completions"])
+async def test_stream_body_is_async_generator(ctx: RequestContext, path: str) -> None:
+    """Test that streams are served by an async generator.
+
+    Starlette runs sync iterators through a thread pool, one hop per chunk.
+    """
+    handler = make_handler(UpstreamRecorder())
+
+    response = await handler.handle(make_request_data(), path, 30.0, ctx)
+
+    assert isinstance(response, StreamingResponse)
+    assert inspect.isasyncgen(response.body_iterator)
+    await collect(response)
+
+
+async def test_openai_stream_is_converted(ctx: RequestContext) -> None:
+    """Test that OpenAI-path requests receive OpenAI chunk SSE."""
+    upstream = UpstreamRecorder()
+    handler = make_handler(upstream)
+
+    response = await handler.handle(
+        make_request_data(), "/v1/chat/completions", 30.0, ctx
+    )
+    body = await collect(response)
+
+    assert len(upstream.requests) == 1
+    assert body.startswith(b"data: {")
+    assert b'"object":"chat.completion.chunk"' in body
+    assert b'"content":"Hello"' in body
+
+
+async def test_openai_stream_frames_are_json(ctx: RequestContext) -> None:
+    """Test that each OpenAI SSE frame carries one JSON chunk, non-ASCII intact."""
+    upstream = UpstreamRecorder(
+        content=ANTHROPIC_SSE.replace(b"Hello", "H\u00e9llo \u2713".encode())
+    )
+    handler = make_handler(upstream)
+
+    response = await handler.handle(
+        make_request_data(), "/v1/chat/completions", 30.0, ctx
+    )
+    body = await collect(response)
+
+    frames = body.split(b"\n\n")
+    assert frames.pop() == b""
+    assert all(frame.startswith(b"data: ") for frame in frames)
+    chunks = [orjson.loads(frame.removeprefix(b"data: ")) for frame in frames]
+    contents = [
+        choice["delta"].get("content")
+        for chunk in chunks
+        for choice in chunk["choices"]
+    ]
+    assert "H\u00e9llo \u2713" in contents
+
+
+async def test_stream_path_classified_once(ctx: RequestContext) -> None:
+    """Test that the OpenAI path check runs once per streamed request."""
+    handler = make_handler(UpstreamRecorder())
+
+    with patch.object(
+        handler.response_transformer, "_is_openai_request", return_value=True
+    ) as mock_is_openai:
+        response = await handler.handle(
+            make_request_data(), "/v1/chat/completions", 30.0, ctx
+        )
+        body = await collect(response)
+
+    mock_is_openai.assert_called_once_with("/v1/chat/completions")
+    assert b'"object":"chat.completion.chunk"' in body
+
+
+async def test_error_returned_before_streaming(ctx: RequestContext) -> None:
+    """Test that upstream errors are returned as a tuple, not a stream."""
+    error_body = b'{"type":"error","error":{"type":"rate_limit_error","message":"x"}}'
+    upstream = UpstreamRecorder(status_code=429, content=error_body)
+    handler = make_handler(upstream)
+
+    result = await handler.handle(make_request_data(), "/v1/messages", 30.0, ctx)
+
+    assert len(upstream.requests) == 1
+    assert isinstance(result, tuple)
+    status_code, headers, body = result
+    assert status_code == 429
+    assert headers["content-type"] == "application/json"
+    assert body == error_body
+
+
+async def test_error_response_not_held_by_verbose_logging(
+    ctx: RequestContext,
+) -> None:
+    """Test that the verbose error log is written after the error is returned."""
+    error_body = b'{"type":"error","error":{"type":"overloaded_error"}}'
+    handler = make_handler(UpstreamRecorder(status_code=529, content=error_body))
+    handler.verbose_logger = VerboseLogger(verbose_api=True, verbose_streaming=False)
+    log_release = asyncio.Event()
+
+    async def slow_log(*args: Any) -> None:
+        await log_release.wait()
+
+    with (
+        patch.object(handler.verbose_logger, "log_api_request", AsyncMock()),
+        patch.object(
+            handler.verbose_logger, "log_api_response", side_effect=slow_log
+        ) as mock_log,
+    ):
+        result = await asyncio.wait_for(
+            handler.handle(make_request_data(), "/v1/messages", 30.0, ctx), 1.0
+        )
+        log_release.set()
+        await asyncio.sleep(0)
+
+    assert isinstance(result, tuple)
+    assert result[0] == 529
+    assert result[2] == error_body
+    mock_log.assert_called_once()
+    assert mock_log.call_args.args[2] == error_body
+
+
+async def test_compressed_stream_is_decoded(ctx: RequestContext) -> None:
+    """Test that content-encoded upstream streams are still decoded."""
+
+    class GzipUpstream(UpstreamRecorder):
+        def __call__(self, request: httpx.Request) -> httpx.Response:
+            self.requests.append(request)
+            return httpx.Response(
+                200,
+                headers={
+                    "content-type": "text/event-stream",
+                    "content-encoding": "gzip",
+                },
+                stream=httpx.ByteStream(gzip.compress(self.content)),
+            )
+
+    upstream = GzipUpstream()
+    handler = make_handler(upstream)
+
+    response = await handler.handle(make_request_data(), "/v1/messages", 30.0, ctx)
+    body = await collect(response)
+
+    assert body == ANTHROPIC_SSE
+
+
+async def test_stream_headers_drop_upstream_framing(ctx: RequestContext) -> None:
+    """Test that upstream framing headers are not forwarded on the stream."""
+
+    class FramedUpstream(UpstreamRecorder):
+        def __call__(self, request: httpx.Request) -> httpx.Response:
+            self.requests.append(request)
+            return httpx.Response(
+                200,
+                headers={
+                    "content-type": "text/event-stream",
+                    "content-length": str(len(self.content)),
+                    "date": "Mon, 01 Jan 2024 00:00:00 GMT",
+                    "cache-control": "max-age=60",
+                    "request-id": "req_upstream",
+                },
+                stream=httpx.ByteStream(self.content),
+            )
+
+    handler = make_handler(FramedUpstream())
+
+    response = await handler.handle(
+        make_request_data(), "/v1/chat/completions", 30.0, ctx
+    )
+
+    assert isinstance(response, StreamingResponse)
+    assert "content-length" not in response.headers
+    assert "date" not in response.headers
+    assert response.headers.getlist("cache-control") == ["no-cache"]
+    assert response.headers["connection"] == "keep-alive"
+    assert response.headers["request-id"] == "req_upstream"
+    await collect(response)
+
+
+async def test_json_response_is_buffered(ctx: RequestContext) -> None:
+    """Test that a non-SSE success body is returned whole, not streamed."""
+    json_body = b'{"id":"msg_1","type":"message","content":[]}'
+
+    class JSONUpstream(UpstreamRecorder):
+        def __call__(self, request: httpx.Request) -> httpx.Response:
+            self.requests.append(request)
+            return httpx.Response(
+                200,
+                headers={"content-type": "application/json"},
+                stream=httpx.ByteStream(self.content),
+            )
+
+    upstream = JSONUpstream(content=json_body)
+    handler = make_handler(upstream)
+
+    result = await handler.handle(make_request_data(), "/v1/messages", 30.0, ctx)
+
+    assert len(upstream.requests) == 1
+    assert isinstance(result, tuple)
+    status_code, headers, body = result
+    assert status_code == 200
+    assert headers["Content-Length"] == str(len(json_body))
+    assert body == json_body
+
+
+@pytest.mark.parametrize("path", ["/v1/messages", "/v1/chat/completions"])
+async def test_stream_chunks_not_logged_when_request_logging_disabled(
+    ctx: RequestContext, monkeypatch: pytest.MonkeyPatch, path: str
+) -> None:
+    """Test that chunk logging is skipped unless request logging is on."""
+    monkeypatch.delenv("CCPROXY_LOG_REQUESTS", raising=False)
+    handler = make_handler(UpstreamRecorder())
+
+    with patch.object(streaming_handler_module, "append_streaming_log") as mock_log:
+        response = await handler.handle(make_request_data(), path, 30.0, ctx)
+        await collect(response)
+
+    mock_log.assert_not_called()
+
+    monkeypatch.setenv("CCPROXY_LOG_REQUESTS", "true")
+
+    with patch.object(streaming_handler_module, "append_streaming_log") as mock_log:
+        response = await handler.handle(make_request_data(), path, 30.0, ctx)
+        await collect(response)
+
+    mock_log.assert_called()
+
+
+async def test_stream_error_frame_is_valid_json(ctx: RequestContext) -> None:
+    """Test that a mid-stream failure yields one well-formed SSE error frame."""
+
+    class FailingStream(httpx.AsyncByteStream):
+        async def __aiter__(self) -> Any:
+            yield ANTHROPIC_SSE[:40]
+            raise httpx.ReadError('upstream said "bye"\nclosed')
+
+    def upstream(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(
+            200, headers={"content-type": "text/event-stream"}, stream=FailingStream()
+        )
+
+    handler = make_handler(UpstreamRecorder())
+    handler.http_client._client = httpx.AsyncClient(  # type: ignore[attr-defined]
+        transport=httpx.MockTransport(upstream)
+    )
+
+    response = await handler.handle(make_request_data(), "/v1/messages", 30.0, ctx)
+    body = await collect(response)
+
+    frame = body.removeprefix(ANTHROPIC_SSE[:40])
+    assert frame.startswith(b"data: ")
+    assert frame.endswith(b"\n\n")
+    assert orjson.loads(frame[6:]) == {
+        "error": 'Streaming error: upstream said "bye"\nclosed'
+    }
+
+
+async def test_verbose_stream_logs_header_snapshot(ctx: RequestContext) -> None:
+    """Test that verbose stream logging receives the upstream header snapshot."""
+    handler = make_handler(UpstreamRecorder())
+    handler.verbose_logger = VerboseLogger(verbose_api=True, verbose_streaming=False)
+
+    with (
+        patch.object(handler.verbose_logger, "log_api_request", AsyncMock()),
+        patch.object(
+            handler.verbose_logger, "log_stream_response_headers", AsyncMock()
+        ) as mock_log_headers,
+    ):
+        response = await handler.handle(make_request_data(), "/v1/messages", 30.0, ctx)
+        await collect(response)
+
+    kwargs = mock_log_headers.await_args.kwargs
+    assert kwargs["status_code"] == 200
+    assert kwargs["headers"]["content-type"] == "text/event-stream"
+    assert kwargs["is_openai"] is False
+
+
+async def aiter_chunks(chunks: list[bytes]) -> AsyncIterator[bytes]:
+    """Yield the given chunks as an async byte stream."""
+    for chunk in chunks:
+        yield chunk
+
+
+@pytest.mark.parametrize("size", [1, 7, len(ANTHROPIC_SSE)])
+async def test_sse_data_split_across_chunks(size: int) -> None:
+    """Test that event data is recovered however the stream is fragmented."""
+    chunks = [ANTHROPIC_SSE[i : i + size] for i in range(0, len(ANTHROPIC_SSE), size)]
+
+    events = [data async for data in _aiter_sse_data(aiter_chunks(chunks))]
+
+    assert [orjson.loads(data)["type"] for data in events] == [
+        "message_start",
+        "content_block_start",
+        "content_block_delta",
+        "message_stop",
+    ]
+
+
+async def test_sse_data_field_handling() -> None:
+    """Test CRLF lines, comments, multi-line data and unterminated events."""
+    stream = (
+        b": keep-alive\r\n\r\n"
+        b"event: ping\r\ndata: {}\r\n\r\n"
+        b"data:first\ndata: second\n\n"
+        b"data: [DONE]\n\n"
+        b"data: partial"
+    )
+
+    events = [data async for data in _aiter_sse_data(aiter_chunks([stream]))]
+
+    assert events == [b"{}", b"first\nsecond", b"[DONE]"]
+
+
+@pytest.mark.parametrize("split", [1, 7, 8, 9])
+async def test_sse_data_bare_cr_and_empty_data(split: int) -> None:
+    """Test bare CR line endings and a data field without a colon."""
+    stream = b"data: a\r\r\ndata\r\n\r\ndata: b\r\r"
+    chunks = [stream[:split], stream[split:]]
+
+    events = [data async for data in _aiter_sse_data(aiter_chunks(chunks))]
+
+    assert events == [b"a", b"", b"b"]
@@ -0,0 +1,128 @@
+"""Tests for the verbose API logger.
+
+Request log files are written to a temporary directory through the
+CCPROXY_LOG_REQUESTS and CCPROXY_REQUEST_LOG_DIR switches.
+"""
+
+import logging
+from pathlib import Path
+from unittest.mock import patch
+
+import orjson
+import pytest
+
+from claude_code_proxy.core.http_transformers import RequestData
+from claude_code_proxy.core.request_context import RequestContext
+from claude_code_proxy.services import verbose_logger as verbose_logger_module
+from claude_code_proxy.services.verbose_logger import VerboseLogger, _body_preview
+
+
+@pytest.fixture
+def log_dir(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Path:
+    """Enable request logging into a temporary directory."""
+    monkeypatch.setenv("CCPROXY_LOG_REQUESTS", "true")
+    monkeypatch.setenv("CCPROXY_REQUEST_LOG_DIR", str(tmp_path))
+    return tmp_path
+
+
+@pytest.fixture
+def ctx() -> RequestContext:
+    """Create a request context."""
+    return RequestContext(request_id="req-test", method="POST", path="/v1/messages")
+
+
+def read_log(log_dir: Path, log_type: str) -> dict[str, object]:
+    """Load the single request log file of the given type."""
+    (path,) = log_dir.glob(f"*_req-test_{log_type}.json")
+    return orjson.loads(path.read_bytes())  # type: ignore[no-any-return]
+
+
+async def test_log_api_request_parses_json_body(
+    log_dir: Path, ctx: RequestContext
+) -> None:
+    """Test that a JSON request body is logged as parsed JSON."""
+    request_data: RequestData = {
+        "method": "POST",
+        "url": "https://api.anthropic.com/v1/messages",
+        "headers": {"content-type": "application/json"},
+        "body": '{"model":"claude","text":"héllo"}'.encode(),
+    }
+
+    await VerboseLogger(verbose_api=True).log_api_request(request_data, ctx)
+
+    logged = read_log(log_dir, "upstream_request")
+    assert logged["body"] == {"model": "claude", "text": "héllo"}
+    assert logged["headers"] == {"content-type": "application/json"}
+
+
+@pytest.mark.parametrize(
+    ("body", "expected"),
+    [
+        (b'{"id":"msg_1"}', {"id": "msg_1"}),
+        (b"upstream unavailable", "upstream unavailable"),
+        (b"bad \xff byte", "bad � byte"),
+    ],
+)
+async def test_log_api_response_body(
+    log_dir: Path, ctx: RequestContext, body: bytes, expected: object
+) -> None:
+    """Test that response bodies are logged as JSON or as decoded text."""
+    await VerboseLogger(verbose_api=True).log_api_response(
+        200, {"content-type": "application/json"}, body, ctx
+    )
+
+    logged = read_log(log_dir, "upstream_response")
+    assert logged["status_code"] == 200
+    assert logged["body"] == expected
+
+
+async def test_log_api_response_skipped_when_disabled(
+    log_dir: Path, ctx: RequestContext
+) -> None:
+    """Test that nothing is written without verbose API logging."""
+    await VerboseLogger(verbose_api=False).log_api_response(200, {}, b"{}", ctx)
+
+    assert list(log_dir.iterdir()) == []
+
+
+@pytest.mark.parametrize(
+    ("verbose_api", "verbose_streaming", "logged"),
+    [(False, False, False), (True, False, True), (False, True, True)],
+)
+async def test_log_streaming_chunk_respects_verbose_flags(
+    ctx: RequestContext, verbose_api: bool, verbose_streaming: bool, logged: bool
+) -> None:
+    """Test that streaming chunks are only logged with a verbose flag set."""
+    verbose_logger = VerboseLogger(
+        verbose_api=verbose_api, verbose_streaming=verbose_streaming
+    )
+
+    with patch(
+        "claude_code_proxy.services.verbose_logger.append_streaming_log"
+    ) as mock_append:
+        await verbose_logger.log_streaming_chunk(ctx, b"data: {}\n\n")
+
+    assert mock_append.called is logged
+
+
+async def test_headers_not_redacted_when_info_filtered(
+    log_dir: Path, ctx: RequestContext, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test that redaction is skipped when the info event would be dropped."""
+    caplog.set_level(logging.WARNING, logger=verbose_logger_module.__name__)
+
+    with patch.object(verbose_logger_module, "redact_sensitive_headers") as mock_redact:
+        await VerboseLogger(verbose_api=True).log_api_response(
+            200, {"authorization": "Bearer secret"}, b"{}", ctx
+        )
+
+    mock_redact.assert_not_called()
+    assert read_log(log_dir, "upstream_response")["body"] == {}
+
+
+@pytest.mark.parametrize("text", ["a" * 5000, "é" * 5000, "\U0001f600" * 5000, "short"])
+def test_body_preview_matches_full_decode(text: str) -> None:
+    """Test that the bounded preview equals truncating the full decode."""
+    body = text.encode()
+
+    assert _body_preview(body) == body.decode()[:1024]
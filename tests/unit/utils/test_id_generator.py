@@ -0,0 +1,45 @@
+"""Unit tests for ID generation utilities."""
+
+from claude_code_proxy.utils.id_generator import (
+    generate_client_id,
+    generate_request_id,
+)
+
+
+class TestGenerateRequestId:
+    """Test request ID generation."""
+
+    def test_request_ids_are_unique(self) -> None:
+        """Test that consecutive request IDs never repeat."""
+        ids = [generate_request_id() for _ in range(1000)]
+
+        assert len(set(ids)) == len(ids)
+
+    def test_request_ids_share_process_prefix(self) -> None:
+        """Test that request IDs are hex with a stable per-process prefix."""
+        first = generate_request_id()
+        second = generate_request_id()
+
+        assert first[:8] == second[:8]
+        assert first != second
+        int(first, 16)
+        int(second, 16)
+
+    def test_request_ids_do_not_expose_counter(self) -> None:
+        """Test that consecutive IDs do not differ by a visible counter step."""
+        first = generate_request_id()
+        second = generate_request_id()
+
+        assert int(second[8:], 16) - int(first[8:], 16) != 1
+
+
+class TestGenerateClientId:
+    """Test SDK client ID generation."""
+
+    def test_client_ids_are_short_and_unique(self) -> None:
+        """Test that client IDs are 22-character unique strings."""
+        first = generate_client_id()
+        second = generate_client_id()
+
+        assert len(first) == 22
+        assert first != second
@@ -0,0 +1,206 @@
+"""Tests for the simple request logger environment switches."""
+
+import asyncio
+from pathlib import Path
+from unittest.mock import patch
+
+import httpx
+import orjson
+import pytest
+
+from claude_code_proxy.utils import simple_request_logger
+from claude_code_proxy.utils.simple_request_logger import (
+    append_streaming_log,
+    flush_all_streaming_batches,
+    get_request_log_dir,
+    get_timestamp_prefix,
+    should_log_requests,
+    write_request_log,
+)
+
+
+@pytest.mark.parametrize("value", ["true", "True", "TRUE", "tRue"])
+def test_should_log_requests_enabled(
+    monkeypatch: pytest.MonkeyPatch, value: str
+) -> None:
+    """Test that true in any case enables request logging."""
+    monkeypatch.setenv("CCPROXY_LOG_REQUESTS", value)
+
+    assert should_log_requests() is True
+
+
+@pytest.mark.parametrize("value", ["false", "0", ""])
+def test_should_log_requests_disabled(
+    monkeypatch: pytest.MonkeyPatch, value: str
+) -> None:
+    """Test that other values leave request logging off."""
+    monkeypatch.setenv("CCPROXY_LOG_REQUESTS", value)
+
+    assert should_log_requests() is False
+
+
+def test_should_log_requests_unset(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that request logging is off when the variable is unset."""
+    monkeypatch.delenv("CCPROXY_LOG_REQUESTS", raising=False)
+
+    assert should_log_requests() is False
+
+
+async def test_write_request_log_writes_json_file(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Test that request logs are indented JSON ending in a newline."""
+    monkeypatch.setenv("CCPROXY_LOG_REQUESTS", "true")
+    monkeypatch.setenv("CCPROXY_REQUEST_LOG_DIR", str(tmp_path))
+
+    await write_request_log(
+        request_id="req-1",
+        log_type="upstream_request",
+        data={"method": "POST", "body": {"model": "claude"}},
+        timestamp="20240101000000",
+    )
+
+    content = (tmp_path / "20240101000000_req-1_upstream_request.json").read_bytes()
+    assert content.endswith(b"}\n")
+    assert orjson.loads(content) == {"method": "POST", "body": {"model": "claude"}}
+
+
+async def test_write_request_log_serializes_header_mappings(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Test that header mappings are logged as objects without a dict copy."""
+    monkeypatch.setenv("CCPROXY_LOG_REQUESTS", "true")
+    monkeypatch.setenv("CCPROXY_REQUEST_LOG_DIR", str(tmp_path))
+
+    await write_request_log(
+        request_id="req-1",
+        log_type="upstream_response_headers",
+        data={"headers": httpx.Headers({"Content-Type": "text/event-stream"})},
+        timestamp="20240101000000",
+    )
+
+    path = tmp_path / "20240101000000_req-1_upstream_response_headers.json"
+    assert orjson.loads(path.read_bytes()) == {
+        "headers": {"content-type": "text/event-stream"}
+    }
+
+
+def test_get_request_log_dir_creates_directory_once(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Test that the log directory is created on first use only."""
+    log_dir = tmp_path / "logs" / "requests"
+    monkeypatch.setenv("CCPROXY_REQUEST_LOG_DIR", str(log_dir))
+
+    assert get_request_log_dir() == log_dir
+    assert log_dir.is_dir()
+
+    with patch.object(Path, "mkdir") as mock_mkdir:
+        assert get_request_log_dir() == log_dir
+
+    mock_mkdir.assert_not_called()
+
+
+def test_get_request_log_dir_retries_after_failure(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Test that a failed directory creation is attempted again later."""
+    log_dir = tmp_path / "retry"
+    monkeypatch.setenv("CCPROXY_REQUEST_LOG_DIR", str(log_dir))
+
+    with patch.object(Path, "mkdir", side_effect=PermissionError("denied")):
+        assert get_request_log_dir() is None
+
+    assert get_request_log_dir() == log_dir
+    assert log_dir.is_dir()
+
+
+async def test_logs_recreate_directory_removed_after_creation(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Test that writes recreate a log directory deleted after first use."""
+    log_dir = tmp_path / "cleaned"
+    monkeypatch.setenv("CCPROXY_LOG_REQUESTS", "true")
+    monkeypatch.setenv("CCPROXY_REQUEST_LOG_DIR", str(log_dir))
+
+    await write_request_log("req-1", "upstream_request", {}, "20240101000000")
+    (log_dir / "20240101000000_req-1_upstream_request.json").unlink()
+    log_dir.rmdir()
+
+    await write_request_log("req-2", "upstream_request", {}, "20240101000000")
+    json_path = log_dir / "20240101000000_req-2_upstream_request.json"
+    assert json_path.is_file()
+
+    json_path.unlink()
+    log_dir.rmdir()
+
+    await append_streaming_log("req-3", "upstream_streaming", b"x", "20240101000000")
+    await flush_all_streaming_batches()
+    raw_path = log_dir / "20240101000000_req-3_upstream_streaming.raw"
+    assert raw_path.read_bytes() == b"x"
+
+
+async def test_append_streaming_log_formats_timestamp_per_batch(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Test that chunks of one batch share a timestamp formatted once."""
+    monkeypatch.setenv("CCPROXY_LOG_REQUESTS", "true")
+    monkeypatch.setenv("CCPROXY_REQUEST_LOG_DIR", str(tmp_path))
+
+    with patch.object(
+        simple_request_logger,
+        "get_timestamp_prefix",
+        return_value="20240101000000",
+    ) as mock_timestamp:
+        for chunk in (b"data: 1\n\n", b"data: 2\n\n", b"data: 3\n\n"):
+            await append_streaming_log(
+                request_id="req-1", log_type="upstream_streaming", data=chunk
+            )
+        await flush_all_streaming_batches()
+
+    mock_timestamp.assert_called_once()
+    path = tmp_path / "20240101000000_req-1_upstream_streaming.raw"
+    assert path.read_bytes() == b"data: 1\n\ndata: 2\n\ndata: 3\n\n"
+
+
+def test_get_timestamp_prefix_reformats_only_on_new_second() -> None:
+    """Test that the prefix is UTC and cached within the same second."""
+    with patch.object(simple_request_logger.time, "time", return_value=1704067200.2):
+        assert get_timestamp_prefix() == "20240101000000"
+
+    with (
+        patch.object(simple_request_logger.time, "time", return_value=1704067200.9),
+        patch.object(simple_request_logger.time, "strftime") as mock_strftime,
+    ):
+        assert get_timestamp_prefix() == "20240101000000"
+    mock_strftime.assert_not_called()
+
+    with patch.object(simple_request_logger.time, "time", return_value=1704067201.0):
+        assert get_timestamp_prefix() == "20240101000001"
+
+
+async def test_append_streaming_log_schedules_one_flush_per_batch(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    """Test that a batch gets one delayed flush, not one task per chunk."""
+    monkeypatch.setenv("CCPROXY_LOG_REQUESTS", "true")
+    monkeypatch.setenv("CCPROXY_REQUEST_LOG_DIR", str(tmp_path))
+    monkeypatch.setattr(simple_request_logger, "_STREAMING_BATCH_TIMEOUT", 0.01)
+
+    with patch.object(
+        simple_request_logger.asyncio, "create_task", wraps=asyncio.create_task
+    ) as mock_create_task:
+        for chunk in (b"data: 1\n\n", b"data: 2\n\n", b"data: 3\n\n"):
+            await append_streaming_log(
+                request_id="req-2",
+                log_type="upstream_streaming",
+                data=chunk,
+                timestamp="20240101000000",
+            )
+
+    assert mock_create_task.call_count == 1
+
+    await asyncio.sleep(0.05)
+
+    path = tmp_path / "20240101000000_req-2_upstream_streaming.raw"
+    assert path.read_bytes() == b"data: 1\n\ndata: 2\n\ndata: 3\n\n"
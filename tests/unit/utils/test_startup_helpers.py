@@ -23,11 +23,13 @@ from claude_code_proxy.utils.startup_helpers import (
     flush_streaming_batches_shutdown,
     initialize_claude_detection_startup,
     initialize_claude_sdk_startup,
+    initialize_http_client_startup,
     initialize_permission_service_startup,
     setup_permission_service_shutdown,
     setup_scheduler_shutdown,
     setup_scheduler_startup,
     setup_session_manager_shutdown,
+    shutdown_http_client,
     validate_claude_authentication_startup,
 )
 
@@ -524,6 +526,33 @@ class TestFlushStreamingBatchesShutdown:
                 assert call_args["error"] == "Flush failed"
 
 
+class TestHTTPClientLifecycle:
+    """Test shared upstream HTTP client startup and shutdown."""
+
+    @pytest.fixture
+    def mock_app(self) -> FastAPI:
+        """Create a mock FastAPI app."""
+        return FastAPI()
+
+    async def test_http_client_startup_and_shutdown(self, mock_app: FastAPI) -> None:
+        """Test the client is stored in app state and closed on shutdown."""
+        from claude_code_proxy.core.http import HTTPXClient
+
+        await initialize_http_client_startup(mock_app, Mock(spec=Settings))
+        http_client = mock_app.state.http_client
+        assert isinstance(http_client, HTTPXClient)
+
+        with patch.object(http_client, "close", new=AsyncMock()) as mock_close:
+            await shutdown_http_client(mock_app)
+            mock_close.assert_awaited_once()
+
+        assert mock_app.state.http_client is None
+
+    async def test_http_client_shutdown_without_client(self, mock_app: FastAPI) -> None:
+        """Test shutdown is a no-op when no client was created."""
+        await shutdown_http_client(mock_app)
+
+
 class TestClaudeDetectionStartup:
     """Test Claude detection service initialization."""
 
@@ -0,0 +1,59 @@
+"""Unit tests for streaming metrics extraction."""
+
+from claude_code_proxy.utils.streaming_metrics import StreamingMetricsCollector
+
+
+MESSAGE_START = (
+    b"event: message_start\n"
+    b'data: {"type":"message_start","message":{"id":"msg_1",'
+    b'"usage":{"input_tokens":12,"cache_read_input_tokens":4}}}\n\n'
+)
+MESSAGE_DELTA = (
+    b"event: message_delta\n"
+    b'data: {"type":"message_delta","delta":{"stop_reason":"end_turn"},'
+    b'"usage":{"output_tokens":7}}\n\n'
+)
+
+
+class TestStreamingMetricsCollector:
+    """Test incremental token metric extraction."""
+
+    def test_extracts_usage_from_whole_events(self) -> None:
+        """Test input and output tokens from complete SSE events."""
+        collector = StreamingMetricsCollector(request_id="req-1")
+
+        assert collector.process_chunk(MESSAGE_START) is False
+        assert collector.process_chunk(MESSAGE_DELTA) is True
+
+        metrics = collector.get_metrics()
+        assert metrics["tokens_input"] == 12
+        assert metrics["cache_read_tokens"] == 4
+        assert metrics["tokens_output"] == 7
+
+    def test_extracts_usage_split_across_chunks(self) -> None:
+        """Test that an event cut mid-line is parsed once completed."""
+        collector = StreamingMetricsCollector()
+        stream = MESSAGE_START + MESSAGE_DELTA
+        split = stream.index(b"output_tokens")
+
+        assert collector.process_chunk(stream[:split]) is False
+        assert collector.get_metrics()["tokens_output"] is None
+        assert collector.process_chunk(stream[split:]) is True
+
+        metrics = collector.get_metrics()
+        assert metrics["tokens_input"] == 12
+        assert metrics["tokens_output"] == 7
+
+    def test_extracts_usage_from_line_split_over_many_chunks(self) -> None:
+        """Test that a line delivered a few bytes at a time is parsed once."""
+        collector = StreamingMetricsCollector()
+        stream = MESSAGE_START + MESSAGE_DELTA
+        chunks = [stream[i : i + 3] for i in range(0, len(stream), 3)]
+
+        results = [collector.process_chunk(chunk) for chunk in chunks]
+
+        assert results.count(True) == 1
+        metrics = collector.get_metrics()
+        assert metrics["tokens_input"] == 12
+        assert metrics["tokens_output"] == 7
+        assert not collector._tail